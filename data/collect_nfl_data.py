@@ -15,12 +15,15 @@ def main():
             break
     
     if df is not None:
-        # Extract tendencies
-        tendencies = collector.extract_play_tendencies(df)
-        collector.save_tendencies(tendencies)
+        # Use the Polars extract path when it's installed, otherwise pandas
+        extracted = collector.extract_with_polars(season)
+        if extracted is not None:
+            tendencies, outcomes = extracted
+        else:
+            # Extract tendencies and play outcomes in one pass
+            tendencies, outcomes = collector.extract_all(df)
         
-        # Extract play outcomes
-        outcomes = collector.extract_play_outcomes(df)
+        collector.save_tendencies(tendencies)
         collector.save_outcomes(outcomes)
         
         print("NFL data processing complete. Check the data/nfl_data directory for results.")
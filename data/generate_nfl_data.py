@@ -26,7 +26,7 @@ def main():
     # Generate play data
     plays = generator.generate_season_data(num_games)
     
-    if plays and len(plays) > 0:
+    if plays and len(plays['play_id']) > 0:
         # Save to CSV
         csv_file = generator.save_plays_to_csv(plays)
         
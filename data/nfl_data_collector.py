@@ -3,6 +3,27 @@ import os
 import json
 from datetime import datetime
 
+# Yards-to-go ranges used for distance-based tendencies, as (0, 3], (3, 6], ...
+DISTANCE_BINS = [0, 3, 6, 10, 15, 100]
+DISTANCE_KEYS = ['distance_1_to_3', 'distance_4_to_6', 'distance_7_to_10',
+                 'distance_11_to_15', 'distance_16_to_100']
+
+# Play-by-play columns read by the extractors; everything else is left on disk
+PBP_COLUMNS = ['down', 'ydstogo', 'play_type', 'play_type_nfl', 'yards_gained', 'yards_gained_nfl']
+
+# Compact dtypes for PBP_COLUMNS when reading CSV (nullable ints, play types as categories)
+PBP_DTYPES = {
+    'down': 'Int8',
+    'ydstogo': 'Int16',
+    'play_type': 'category',
+    'play_type_nfl': 'category',
+    'yards_gained': 'Int16',
+    'yards_gained_nfl': 'Int16'
+}
+
+# Upper-cased raw play types mapped onto the standardized 'pass'/'run' labels
+STD_PLAY_TYPES = {'PASS': 'pass', 'RUSH': 'run', 'RUN': 'run'}
+
 class NFLDataCollector:
     """
     Class for collecting and processing NFL data using nfl_data_py package
@@ -18,8 +39,7 @@ class NFLDataCollector:
         self.data_dir = data_dir
         
         # Create data directory if it doesn't exist
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        os.makedirs(data_dir, exist_ok=True)
     
     def download_season_data(self, season):
         """
@@ -40,9 +60,13 @@ class NFLDataCollector:
             # Use nfl_data_py to fetch play-by-play data
             df = nfl.import_pbp_data([season])
             
-            # Save to our data directory
-            output_file = os.path.join(self.data_dir, f"pbp_{season}.csv")
-            df.to_csv(output_file, index=False)
+            # Save to our data directory (Parquet when pyarrow is available)
+            try:
+                output_file = os.path.join(self.data_dir, f"pbp_{season}.parquet")
+                df.to_parquet(output_file, engine='pyarrow', compression='zstd', index=False)
+            except ImportError:
+                output_file = os.path.join(self.data_dir, f"pbp_{season}.csv")
+                df.to_csv(output_file, index=False)
             
             print(f"Successfully downloaded {len(df)} plays from {season}")
             return df
@@ -61,25 +85,67 @@ class NFLDataCollector:
         Returns:
             pandas.DataFrame: Play-by-play data
         """
+        parquet_path = os.path.join(self.data_dir, f"pbp_{season}.parquet")
         file_path = os.path.join(self.data_dir, f"pbp_{season}.csv")
         
-        # Check if we already have the data locally
-        if os.path.exists(file_path):
+        # Check if we already have the data locally, preferring Parquet over CSV
+        if os.path.exists(parquet_path):
+            print(f"Loading {season} data from local file...")
+            return self._read_parquet_columns(parquet_path)
+        elif os.path.exists(file_path):
             print(f"Loading {season} data from local file...")
-            return pd.read_csv(file_path, low_memory=False)
+            return self._read_csv_columns(file_path)
         else:
             # Download if we don't have it
             return self.download_season_data(season)
     
-    def extract_play_tendencies(self, df):
+    def _read_parquet_columns(self, file_path):
         """
-        Extract play-calling tendencies from play-by-play data
+        Read only the play-by-play columns used by the extractors from a Parquet file
+        
+        Args:
+            file_path (str): Path to the Parquet file
+            
+        Returns:
+            pandas.DataFrame: Play-by-play data restricted to PBP_COLUMNS
+        """
+        import pyarrow.parquet as pq
+        
+        available = set(pq.read_schema(file_path).names)
+        columns = [col for col in PBP_COLUMNS if col in available]
+        return pd.read_parquet(file_path, engine='pyarrow', columns=columns)
+    
+    def _read_csv_columns(self, file_path):
+        """
+        Read only the play-by-play columns used by the extractors from a CSV file
+        
+        Args:
+            file_path (str): Path to the CSV file
+            
+        Returns:
+            pandas.DataFrame: Play-by-play data restricted to PBP_COLUMNS
+        """
+        # Columns missing from the file are simply skipped by the usecols filter
+        return pd.read_csv(
+            file_path,
+            usecols=lambda col: col in PBP_DTYPES,
+            dtype=PBP_DTYPES,
+            engine='c'
+        )
+    
+    def extract_all(self, df):
+        """
+        Extract play tendencies and play outcomes from play-by-play data in one pass
+        
+        Offensive plays are filtered and bucketed once, and a single grouped
+        count by down, distance range, play type and yards gained provides
+        everything both outputs need.
         
         Args:
             df (pandas.DataFrame): Play-by-play data
             
         Returns:
-            dict: Dictionary of play tendencies by down, distance, and field position
+            tuple: (tendencies, outcomes) dicts
         """
         # Filter to only include offensive plays (no kickoffs, punts, etc)
         # Note: nfl_data_py uses 'play_type_nfl' instead of 'play_type'
@@ -89,117 +155,309 @@ class NFLDataCollector:
             play_type_col = 'play_type'
         else:
             print("Warning: Could not find play type column")
-            return {}
+            return {}, {}
+        
+        # Identify yards gained column
+        if 'yards_gained' in df.columns:
+            yards_col = 'yards_gained'
+        elif 'yards_gained_nfl' in df.columns:
+            yards_col = 'yards_gained_nfl'
+        else:
+            print("Warning: Could not find yards gained column")
+            yards_col = None
+        
+        # Project just the columns used below so the working set stays small
+        mask = df[play_type_col].isin(['PASS', 'RUSH', 'pass', 'run'])
+        columns = ['down', 'ydstogo', play_type_col] + ([yards_col] if yards_col else [])
+        offensive_plays = df.loc[mask, columns]
+        
+        # Standardize play types and bucket yards-to-go into the distance
+        # ranges used by the simulator
+        keys = [
+            offensive_plays['down'],
+            pd.cut(offensive_plays['ydstogo'], bins=DISTANCE_BINS, labels=DISTANCE_KEYS).rename('dist_bin'),
+            offensive_plays[play_type_col].str.upper().map(STD_PLAY_TYPES).astype('category').rename('std_play_type')
+        ]
+        if yards_col:
+            # Clean up NaN values in yards
+            keys.append(offensive_plays[yards_col].fillna(0).rename('yards'))
+        
+        # Keep plays with a missing down or out-of-range distance here; each
+        # output drops them only where it groups by that level
+        counts = offensive_plays.groupby(keys, observed=True, dropna=False).size()
+        
+        tendencies = self._tendencies_from_counts(counts)
+        outcomes = self._outcomes_from_counts(counts) if yards_col else {}
+        return tendencies, outcomes
+    
+    def extract_play_tendencies(self, df):
+        """
+        Extract play-calling tendencies from play-by-play data
+        
+        Args:
+            df (pandas.DataFrame): Play-by-play data
+            
+        Returns:
+            dict: Dictionary of play tendencies by down, distance, and field position
+        """
+        return self.extract_all(df)[0]
+    
+    def extract_play_outcomes(self, df):
+        """
+        Extract play outcome statistics (yards gained, etc.)
+        
+        Args:
+            df (pandas.DataFrame): Play-by-play data
             
-        offensive_plays = df[df[play_type_col].isin(['PASS', 'RUSH', 'pass', 'run'])]
+        Returns:
+            dict: Dictionary of play outcome statistics
+        """
+        return self.extract_all(df)[1]
+    
+    def _tendencies_from_counts(self, counts):
+        """
+        Build the play tendencies dict from grouped play counts
         
-        # Standardize play types
-        offensive_plays['std_play_type'] = offensive_plays[play_type_col].apply(
-            lambda x: 'pass' if x.upper() == 'PASS' else 'run'
+        Args:
+            counts (pandas.Series): Play counts indexed by down, dist_bin,
+                std_play_type (and yards)
+            
+        Returns:
+            dict: Dictionary of play tendencies by down and distance
+        """
+        # Count play types per down and per down/distance
+        down_counts = self._summarize_play_counts(
+            counts.groupby(level=['down', 'std_play_type'], observed=True).sum().unstack(fill_value=0)
+        )
+        distance_counts = self._summarize_play_counts(
+            counts.groupby(level=['down', 'dist_bin', 'std_play_type'], observed=True).sum().unstack(fill_value=0)
         )
         
-        # Group by down, distance ranges, and field position
+        # Serialize into the nested dict shape expected by the simulator
         tendencies = {}
         
-        # Process by down
-        for down in range(1, 5):
-            down_plays = offensive_plays[offensive_plays['down'] == down]
-            
-            # Skip if no plays for this down
-            if len(down_plays) == 0:
+        for row in down_counts.itertuples():
+            down = int(row.Index)
+            if down not in range(1, 5):
                 continue
                 
             tendencies[down] = {
-                'total_plays': len(down_plays),
-                'pass_percentage': len(down_plays[down_plays['std_play_type'] == 'pass']) / len(down_plays) * 100,
-                'run_percentage': len(down_plays[down_plays['std_play_type'] == 'run']) / len(down_plays) * 100
+                'total_plays': int(row.total_plays),
+                'pass_percentage': float(row.pass_percentage),
+                'run_percentage': float(row.run_percentage)
             }
-            
-            # Add distance-based tendencies
-            distance_ranges = [(1, 3), (4, 6), (7, 10), (11, 15), (16, 100)]
-            for dist_min, dist_max in distance_ranges:
-                dist_plays = down_plays[(down_plays['ydstogo'] >= dist_min) & (down_plays['ydstogo'] <= dist_max)]
+        
+        for row in distance_counts.itertuples():
+            down, key = int(row.Index[0]), row.Index[1]
+            if down not in tendencies:
+                continue
                 
-                if len(dist_plays) == 0:
-                    continue
-                    
-                key = f"distance_{dist_min}_to_{dist_max}"
-                tendencies[down][key] = {
-                    'total_plays': len(dist_plays),
-                    'pass_percentage': len(dist_plays[dist_plays['std_play_type'] == 'pass']) / len(dist_plays) * 100,
-                    'run_percentage': len(dist_plays[dist_plays['std_play_type'] == 'run']) / len(dist_plays) * 100
-                }
+            tendencies[down][key] = {
+                'total_plays': int(row.total_plays),
+                'pass_percentage': float(row.pass_percentage),
+                'run_percentage': float(row.run_percentage)
+            }
         
         return tendencies
     
-    def extract_play_outcomes(self, df):
+    def _summarize_play_counts(self, counts):
         """
-        Extract play outcome statistics (yards gained, etc.)
+        Convert a frame of pass/run play counts into totals and percentages
         
         Args:
-            df (pandas.DataFrame): Play-by-play data
+            counts (pandas.DataFrame): Play counts with 'pass' and 'run' columns
             
         Returns:
-            dict: Dictionary of play outcome statistics
+            pandas.DataFrame: total_plays, pass_percentage and run_percentage per row
         """
-        # Identify play type column
-        if 'play_type_nfl' in df.columns:
-            play_type_col = 'play_type_nfl'
-        elif 'play_type' in df.columns:
-            play_type_col = 'play_type'
-        else:
-            print("Warning: Could not find play type column")
-            return {}
-        
-        # Identify yards gained column
-        if 'yards_gained' in df.columns:
-            yards_col = 'yards_gained'
-        elif 'yards_gained_nfl' in df.columns:
-            yards_col = 'yards_gained_nfl'
-        else:
-            print("Warning: Could not find yards gained column")
-            return {}
+        counts = counts.reindex(columns=['pass', 'run'], fill_value=0)
+        total = counts['pass'] + counts['run']
+        counts = counts[total > 0]
+        total = total[total > 0]
         
-        # Filter to only include offensive plays
-        offensive_plays = df[df[play_type_col].isin(['PASS', 'RUSH', 'pass', 'run'])].copy()
-        
-        # Standardize play types
-        offensive_plays['std_play_type'] = offensive_plays[play_type_col].apply(
-            lambda x: 'pass' if x.upper() == 'PASS' else 'run'
-        )
+        return pd.DataFrame({
+            'total_plays': total,
+            'pass_percentage': counts['pass'] / total * 100,
+            'run_percentage': counts['run'] / total * 100
+        })
+    
+    def _outcomes_from_counts(self, counts):
+        """
+        Build the play outcomes dict from grouped play counts
         
-        # Clean up NaN values in yards
-        offensive_plays[yards_col] = offensive_plays[yards_col].fillna(0)
+        Args:
+            counts (pandas.Series): Play counts indexed by down, dist_bin,
+                std_play_type and yards
+            
+        Returns:
+            dict: Dictionary of play outcome statistics
+        """
+        # Histogram of yards gained per play type (sorted by yards)
+        yards_counts = counts.groupby(level=['std_play_type', 'yards'], observed=True).sum()
         
         outcomes = {}
         
         for play_type in ['pass', 'run']:
-            type_plays = offensive_plays[offensive_plays['std_play_type'] == play_type]
-            
-            if len(type_plays) == 0:
+            if play_type not in yards_counts.index.get_level_values('std_play_type'):
                 continue
-                
+            
+            yards_dist = yards_counts.loc[play_type]
+            yards_dist = yards_dist[yards_dist > 0]
+            total = int(yards_dist.sum())
+            yards = yards_dist.index.to_numpy(dtype=float)
+            
+            # Median is the average of the two middle plays' yards
+            cumulative = yards_dist.cumsum().to_numpy()
+            lower = yards[cumulative.searchsorted((total - 1) // 2, side='right')]
+            upper = yards[cumulative.searchsorted(total // 2, side='right')]
+            
             # Calculate yards distribution but limit to prevent huge JSON files
-            yards_dist = type_plays[yards_col].value_counts().to_dict()
-            # Convert keys to strings for JSON compatibility and limit to most common values
-            yards_dist = {str(k): int(v) for k, v in sorted(yards_dist.items(), key=lambda x: x[1], reverse=True)[:50]}
+            top_yards = yards_dist.sort_values(ascending=False, kind='stable').head(50)
             
             outcomes[play_type] = {
-                'count': len(type_plays),
-                'yards_mean': float(type_plays[yards_col].mean()),
-                'yards_median': float(type_plays[yards_col].median()),
-                'success_rate': float(len(type_plays[type_plays[yards_col] > 0]) / len(type_plays) * 100),
-                'yards_distribution': yards_dist
+                'count': total,
+                'yards_mean': float((yards * yards_dist.to_numpy()).sum() / total),
+                'yards_median': float((lower + upper) / 2),
+                'success_rate': float(yards_dist[yards_dist.index > 0].sum() / total * 100),
+                # Convert keys to strings for JSON compatibility
+                'yards_distribution': {str(k): int(v) for k, v in top_yards.items()}
             }
         
         return outcomes
     
+    def extract_with_polars(self, season):
+        """
+        Extract play tendencies and outcomes for a season with Polars
+        
+        Scans the season's Parquet file lazily so only the needed columns and
+        offensive plays are read, and aggregates with Polars' multi-threaded
+        engine. Use the pandas extractors when this returns None.
+        
+        Args:
+            season (int): NFL season year
+            
+        Returns:
+            tuple: (tendencies, outcomes) dicts, or None if Polars or the
+                season's Parquet file isn't available
+        """
+        parquet_path = os.path.join(self.data_dir, f"pbp_{season}.parquet")
+        if not os.path.exists(parquet_path):
+            return None
+        
+        try:
+            import polars as pl
+        except ImportError:
+            return None
+        
+        # Identify play type and yards gained columns
+        available = set(pl.read_parquet_schema(parquet_path))
+        play_type_col = next((col for col in ('play_type_nfl', 'play_type') if col in available), None)
+        yards_col = next((col for col in ('yards_gained', 'yards_gained_nfl') if col in available), None)
+        if play_type_col is None or yards_col is None:
+            print("Warning: Could not find play type or yards gained column")
+            return {}, {}
+        
+        # Offensive plays with standardized play types, distance ranges and
+        # NaN yards treated as 0 (values outside DISTANCE_BINS get a placeholder range)
+        plays = (
+            pl.scan_parquet(parquet_path)
+            .select(['down', 'ydstogo', play_type_col, yards_col])
+            .filter(pl.col(play_type_col).is_in(['PASS', 'RUSH', 'pass', 'run']))
+            .select(
+                pl.col('down'),
+                pl.col('ydstogo').cut(DISTANCE_BINS, labels=['below'] + DISTANCE_KEYS + ['above']).alias('dist_bin'),
+                pl.col(play_type_col).str.to_uppercase().replace(STD_PLAY_TYPES).alias('std_play_type'),
+                pl.col(yards_col).cast(pl.Float64).fill_nan(0).fill_null(0).alias('yards')
+            )
+        )
+        
+        counts, stats, yards_counts = pl.collect_all([
+            plays.group_by(['down', 'dist_bin', 'std_play_type']).agg(pl.len().alias('plays')),
+            plays.group_by('std_play_type').agg(
+                pl.len().alias('count'),
+                pl.col('yards').mean().alias('yards_mean'),
+                pl.col('yards').median().alias('yards_median'),
+                ((pl.col('yards') > 0).mean() * 100).alias('success_rate')
+            ),
+            plays.group_by(['std_play_type', 'yards']).agg(pl.len().alias('plays')).sort('plays', descending=True)
+        ])
+        
+        # Sum the (few) grouped counts per down and per down/distance range
+        down_counts = {}
+        distance_counts = {}
+        for down, dist_bin, play_type, num_plays in counts.iter_rows():
+            if down not in range(1, 5):
+                continue
+            down = int(down)
+            down_counts.setdefault(down, {'pass': 0, 'run': 0})[play_type] += num_plays
+            if dist_bin in DISTANCE_KEYS:
+                distance_counts.setdefault((down, dist_bin), {'pass': 0, 'run': 0})[play_type] += num_plays
+        
+        tendencies = {}
+        for down in sorted(down_counts):
+            tendencies[down] = self._play_count_summary(down_counts[down])
+            for key in DISTANCE_KEYS:
+                if (down, key) in distance_counts:
+                    tendencies[down][key] = self._play_count_summary(distance_counts[(down, key)])
+        
+        # Yards distributions, limited to the 50 most frequent values
+        yards_dists = {'pass': {}, 'run': {}}
+        for play_type, yards, num_plays in yards_counts.iter_rows():
+            if len(yards_dists[play_type]) < 50:
+                yards_dists[play_type][str(yards)] = num_plays
+        
+        outcomes = {}
+        for row in stats.sort('std_play_type').iter_rows(named=True):
+            play_type = row['std_play_type']
+            outcomes[play_type] = {
+                'count': row['count'],
+                'yards_mean': float(row['yards_mean']),
+                'yards_median': float(row['yards_median']),
+                'success_rate': float(row['success_rate']),
+                'yards_distribution': yards_dists[play_type]
+            }
+        
+        return tendencies, outcomes
+    
+    def _play_count_summary(self, counts):
+        """
+        Convert pass/run play counts into a total and percentages
+        
+        Args:
+            counts (dict): Play counts keyed by 'pass' and 'run'
+            
+        Returns:
+            dict: total_plays, pass_percentage and run_percentage
+        """
+        total = counts['pass'] + counts['run']
+        return {
+            'total_plays': total,
+            'pass_percentage': counts['pass'] / total * 100,
+            'run_percentage': counts['run'] / total * 100
+        }
+    
     def save_tendencies(self, tendencies, filename='play_tendencies.json'):
         """Save tendencies to a JSON file"""
-        with open(os.path.join(self.data_dir, filename), 'w') as f:
-            json.dump(tendencies, f, indent=2)
+        self._write_json(tendencies, os.path.join(self.data_dir, filename))
         
     def save_outcomes(self, outcomes, filename='play_outcomes.json'):
         """Save outcomes to a JSON file"""
-        with open(os.path.join(self.data_dir, filename), 'w') as f:
-            json.dump(outcomes, f, indent=2)
\ No newline at end of file
+        self._write_json(outcomes, os.path.join(self.data_dir, filename))
+    
+    def _write_json(self, data, file_path):
+        """
+        Write data to a compact JSON file, using orjson when it's installed
+        
+        Args:
+            data (dict): Data to save (int keys are written as strings)
+            file_path (str): Output file path
+        """
+        try:
+            import orjson
+        except ImportError:
+            with open(file_path, 'w') as f:
+                json.dump(data, f)
+            return
+        
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
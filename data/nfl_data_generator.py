@@ -11,27 +11,52 @@ import random
 import time
 from datetime import datetime
 import csv
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from math import sqrt
+
+# Fields of a generated play, in CSV column order
+PLAY_COLUMNS = ('down', 'first_down', 'game_id', 'play_id', 'play_type', 'yards_gained', 'ydstogo')
 
 class NFLDataGenerator:
     """
     Class for generating synthetic NFL play-by-play data with realistic statistics
     """
     
-    def __init__(self, data_dir='data/nfl_data'):
+    def __init__(self, data_dir='data/nfl_data', seed=None):
         """
         Initialize the data generator
         
         Args:
             data_dir (str): Directory to store generated NFL data
+            seed (int): Optional seed for reproducible data
         """
         self.data_dir = data_dir
         
+        # Generator-owned random number generator (seedable, and independent of
+        # the global random module state)
+        self._rng = random.Random(seed)
+        
         # Create data directory if it doesn't exist
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        os.makedirs(data_dir, exist_ok=True)
         
         # Set realistic play distribution parameters
         self.play_distributions = {
+            # Relative frequency of each down across generated plays
+            'down_weights': {1: 40, 2: 30, 3: 25, 4: 5},
+            
+            # Yards-to-go distributions (distance: weight) by down
+            'distance_weights': {
+                1: {10: 1},  # First down is almost always 10 yards
+                2: {1: 3, 2: 4, 3: 5, 4: 6, 5: 7, 6: 10, 7: 15, 8: 15, 9: 14, 10: 10,
+                    11: 5, 12: 3, 13: 1, 14: 1, 15: 1},
+                3: {1: 10, 2: 12, 3: 12, 4: 10, 5: 8, 6: 7, 7: 6, 8: 5, 9: 5, 10: 10,
+                    11: 5, 12: 4, 15: 3, 20: 3},
+                4: {1: 25, 2: 20, 3: 15, 4: 15, 5: 10, 10: 10, 15: 5}
+            },
+            
             # Down-based play calling percentages (pass vs run)
             'down_tendencies': {
                 1: {'pass': 48.3, 'run': 51.7},
@@ -83,6 +108,62 @@ class NFLDataGenerator:
                 'explosive_dist': {'min': 20, 'max': 80, 'mean': 28.0}
             }
         }
+        
+        # Distance ranges for pass percentage adjustments, sorted so the range
+        # containing a distance can be found by bisecting on the range starts
+        distance_ranges = sorted(self.play_distributions['distance_adjustments'].items())
+        self._distance_starts = [min_dist for (min_dist, _), _ in distance_ranges]
+        self._distance_ends = [max_dist for (_, max_dist), _ in distance_ranges]
+        self._distance_adjustments = [adjustment for _, adjustment in distance_ranges]
+        
+        # Precompute cumulative weights for the down/distance draws so batches
+        # don't re-normalize the weights on every call
+        down_weights = self.play_distributions['down_weights']
+        self._down_table = (list(down_weights), list(accumulate(down_weights.values())))
+        self._distance_tables = {
+            down: (list(weights), list(accumulate(weights.values())))
+            for down, weights in self.play_distributions['distance_weights'].items()
+        }
+        
+        # Outcome categories in the order they are checked, paired with the
+        # yard distribution used for each (None means no gain)
+        yards_categories = {
+            'pass': [('incomplete', None), ('loss', 'loss_dist'), ('short', 'short_dist'),
+                     ('medium', 'medium_dist'), ('long', 'long_dist'), ('explosive', 'explosive_dist')],
+            'run': [('loss', 'loss_dist'), ('no_gain', None), ('short', 'short_dist'),
+                    ('medium', 'medium_dist'), ('long', 'long_dist'), ('explosive', 'explosive_dist')]
+        }
+        
+        # Precompute cumulative category thresholds so picking a category is a
+        # single bisect instead of an if/elif ladder per play
+        self._yards_tables = {}
+        for play_type, categories in yards_categories.items():
+            distributions = self.play_distributions[f"{play_type}_yards"]
+            thresholds = []
+            cumulative = 0.0
+            for category, _ in categories[:-1]:
+                cumulative += distributions[category]
+                thresholds.append(cumulative)
+            outcomes = [
+                None if dist_key is None else self._triangular_params(distributions[dist_key])
+                for _, dist_key in categories
+            ]
+            self._yards_tables[play_type] = (thresholds, outcomes)
+    
+    @staticmethod
+    def _triangular_params(distribution):
+        """
+        Precompute the constants of a triangular yards distribution
+        
+        Args:
+            distribution (dict): Dictionary with min, max, and mean values
+            
+        Returns:
+            tuple: (low, high, span, mode fraction) as used by random.triangular
+        """
+        low, high = distribution['min'], distribution['max']
+        span = high - low
+        return low, high, span, (distribution['mean'] - low) / span
     
     def generate_random_yards(self, distribution):
         """
@@ -95,41 +176,70 @@ class NFLDataGenerator:
             int: Random yard value
         """
         # Use triangular distribution to bias toward the mean
-        return round(random.triangular(
+        return round(self._rng.triangular(
             distribution['min'], 
             distribution['max'], 
             distribution['mean']
         ))
     
-    def determine_play_type(self, down, distance):
+    def get_pass_percentage(self, down, distance):
         """
-        Determine play type (pass or run) based on down and distance
+        Get the probability (in %) of a pass play for a down and distance
         
         Args:
             down (int): Down (1-4)
             distance (int): Yards to go
             
         Returns:
-            str: 'pass' or 'run'
+            float: Pass percentage, clamped to 30-90
         """
         # Get base pass probability for this down
         pass_pct = self.play_distributions['down_tendencies'][down]['pass']
         
         # Adjust based on distance
-        for dist_range, adjustment in self.play_distributions['distance_adjustments'].items():
-            min_dist, max_dist = dist_range
-            if min_dist <= distance <= max_dist:
-                pass_pct += adjustment
-                break
+        i = bisect_right(self._distance_starts, distance) - 1
+        if i >= 0 and distance <= self._distance_ends[i]:
+            pass_pct += self._distance_adjustments[i]
         
         # Ensure percentage is within bounds
-        pass_pct = max(30, min(90, pass_pct))
+        return max(30, min(90, pass_pct))
+    
+    def determine_play_type(self, down, distance):
+        """
+        Determine play type (pass or run) based on down and distance
         
-        # Randomly determine play type
-        if random.random() * 100 < pass_pct:
-            return 'pass'
-        else:
-            return 'run'
+        Args:
+            down (int): Down (1-4)
+            distance (int): Yards to go
+            
+        Returns:
+            str: 'pass' or 'run'
+        """
+        return self.determine_play_types([down], [distance])[0]
+    
+    def determine_play_types(self, downs, distances):
+        """
+        Determine play types (pass or run) for a batch of plays
+        
+        Args:
+            downs (list): Down (1-4) for each play
+            distances (list): Yards to go for each play
+            
+        Returns:
+            list: 'pass' or 'run' for each play
+        """
+        rand = self._rng.random
+        
+        # Only a few dozen down/distance combinations occur, so look each one
+        # up once and reuse it for every play in the batch
+        situations = list(zip(downs, distances))
+        pass_pcts = {
+            situation: self.get_pass_percentage(*situation) / 100
+            for situation in set(situations)
+        }
+        
+        # Randomly determine play types
+        return ['pass' if rand() < pass_pcts[situation] else 'run' for situation in situations]
     
     def determine_yards_gained(self, play_type):
         """
@@ -141,85 +251,117 @@ class NFLDataGenerator:
         Returns:
             int: Yards gained
         """
-        dist_key = f"{play_type}_yards"
-        distributions = self.play_distributions[dist_key]
-        
-        # Generate a random number to determine the play outcome category
-        rand_pct = random.random() * 100
+        return self.determine_yards_gained_batch([play_type])[0]
+    
+    def determine_yards_gained_batch(self, play_types):
+        """
+        Determine yards gained for a batch of plays
         
-        # For pass plays
-        if play_type == 'pass':
-            if rand_pct < distributions['incomplete']:
-                return 0  # Incomplete pass
-            
-            rand_pct -= distributions['incomplete']
-            if rand_pct < distributions['loss']:
-                return self.generate_random_yards(distributions['loss_dist'])
-            
-            rand_pct -= distributions['loss']
-            if rand_pct < distributions['short']:
-                return self.generate_random_yards(distributions['short_dist'])
-            
-            rand_pct -= distributions['short']
-            if rand_pct < distributions['medium']:
-                return self.generate_random_yards(distributions['medium_dist'])
-            
-            rand_pct -= distributions['medium']
-            if rand_pct < distributions['long']:
-                return self.generate_random_yards(distributions['long_dist'])
+        Args:
+            play_types (list): 'pass' or 'run' for each play
             
-            # Must be explosive
-            return self.generate_random_yards(distributions['explosive_dist'])
+        Returns:
+            list: Yards gained for each play
+        """
+        rand = self._rng.random
+        tables = self._yards_tables
         
-        # For run plays
-        else:
-            if rand_pct < distributions['loss']:
-                return self.generate_random_yards(distributions['loss_dist'])
-            
-            rand_pct -= distributions['loss']
-            if rand_pct < distributions['no_gain']:
-                return 0  # No gain
-            
-            rand_pct -= distributions['no_gain']
-            if rand_pct < distributions['short']:
-                return self.generate_random_yards(distributions['short_dist'])
-            
-            rand_pct -= distributions['short']
-            if rand_pct < distributions['medium']:
-                return self.generate_random_yards(distributions['medium_dist'])
+        yards = []
+        append = yards.append
+        for play_type in play_types:
+            thresholds, outcomes = tables[play_type]
+            
+            # Pick the outcome category, then draw yards from its distribution
+            outcome = outcomes[bisect_right(thresholds, rand() * 100)]
+            if outcome is None:
+                append(0)  # Incomplete pass / no gain
+                continue
             
-            rand_pct -= distributions['medium']
-            if rand_pct < distributions['long']:
-                return self.generate_random_yards(distributions['long_dist'])
+            # Triangular distribution biased toward the mean (same draw as
+            # random.triangular, inlined with its constants precomputed)
+            low, high, span, mode = outcome
+            u = rand()
+            if u > mode:
+                append(round(high - span * sqrt((1.0 - u) * (1.0 - mode))))
+            else:
+                append(round(low + span * sqrt(u * mode)))
+        
+        return yards
+    
+    def draw_situations(self, num_plays):
+        """
+        Draw realistic downs and distances for a batch of plays
+        
+        Args:
+            num_plays (int): Number of plays to draw
             
-            # Must be explosive
-            return self.generate_random_yards(distributions['explosive_dist'])
+        Returns:
+            tuple: (downs, distances) lists
+        """
+        down_values, down_cum_weights = self._down_table
+        downs = self._rng.choices(down_values, cum_weights=down_cum_weights, k=num_plays)
+        
+        # Draw all distances for each down in a single call
+        distances = [0] * num_plays
+        for down, (values, cum_weights) in self._distance_tables.items():
+            indices = [i for i, play_down in enumerate(downs) if play_down == down]
+            drawn = self._rng.choices(values, cum_weights=cum_weights, k=len(indices))
+            for i, distance in zip(indices, drawn):
+                distances[i] = distance
+        
+        return downs, distances
     
-    def generate_play(self, play_id, game_id, down, distance):
+    def allocate_plays(self, num_plays):
         """
-        Generate a realistic football play
+        Allocate column storage for a batch of generated plays
+        
+        Plays are stored column-wise: one compact int array per numeric field
+        and a list of (shared) play type strings, rather than a dict per play.
         
         Args:
-            play_id (int): Unique play ID
-            game_id (int): Game ID
-            down (int): Down (1-4)
-            distance (int): Yards to go
+            num_plays (int): Number of plays to allocate
             
         Returns:
-            dict: Play information
+            dict: Column name -> array of length num_plays
         """
-        play_type = self.determine_play_type(down, distance)
-        yards_gained = self.determine_yards_gained(play_type)
+        plays = {column: array('i', [0]) * num_plays for column in PLAY_COLUMNS if column != 'play_type'}
+        plays['play_type'] = [None] * num_plays
+        return plays
+    
+    def fill_plays(self, plays, start, end):
+        """
+        Generate downs, distances, play types and yards for a range of plays
         
-        return {
-            'play_id': str(play_id),
-            'game_id': str(game_id),
-            'play_type': play_type,
-            'down': str(down),
-            'ydstogo': str(distance),
-            'yards_gained': str(yards_gained),
-            'first_down': '1' if yards_gained >= distance else '0'
-        }
+        Args:
+            plays (dict): Play columns (see allocate_plays)
+            start (int): Index of the first play to fill
+            end (int): Index one past the last play to fill
+        """
+        downs, distances = self.draw_situations(end - start)
+        play_types = self.determine_play_types(downs, distances)
+        yards_gained = self.determine_yards_gained_batch(play_types)
+        
+        plays['down'][start:end] = array('i', downs)
+        plays['ydstogo'][start:end] = array('i', distances)
+        plays['play_type'][start:end] = play_types
+        plays['yards_gained'][start:end] = array('i', yards_gained)
+        plays['first_down'][start:end] = array(
+            'i', [yards >= distance for yards, distance in zip(yards_gained, distances)]
+        )
+    
+    def set_game_ids(self, plays, game_id, num_plays, offset=0):
+        """
+        Set the game ID and per-game play IDs for one game's plays
+        
+        Args:
+            plays (dict): Play columns (see allocate_plays)
+            game_id (int): Game ID
+            num_plays (int): Number of plays in the game
+            offset (int): Index of the game's first play within the columns
+        """
+        end = offset + num_plays
+        plays['game_id'][offset:end] = array('i', [game_id]) * num_plays
+        plays['play_id'][offset:end] = array('i', range(1, num_plays + 1))
     
     def generate_game(self, game_id, num_plays=150):
         """
@@ -230,36 +372,11 @@ class NFLDataGenerator:
             num_plays (int): Number of plays to generate
             
         Returns:
-            list: List of play dictionaries
+            dict: Play columns (see allocate_plays)
         """
-        plays = []
-        
-        for play_id in range(1, num_plays + 1):
-            # Realistic down and distance distribution
-            down = random.choices([1, 2, 3, 4], weights=[40, 30, 25, 5])[0]
-            
-            # Realistic distance distribution based on down
-            if down == 1:
-                distance = 10  # First down is almost always 10 yards
-            elif down == 2:
-                distance = random.choices(
-                    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
-                    weights=[3, 4, 5, 6, 7, 10, 15, 15, 14, 10, 5, 3, 1, 1, 1]
-                )[0]
-            elif down == 3:
-                distance = random.choices(
-                    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 15, 20],
-                    weights=[10, 12, 12, 10, 8, 7, 6, 5, 5, 10, 5, 4, 3, 3]
-                )[0]
-            else:  # 4th down
-                distance = random.choices(
-                    [1, 2, 3, 4, 5, 10, 15],
-                    weights=[25, 20, 15, 15, 10, 10, 5]
-                )[0]
-                
-            play = self.generate_play(play_id, game_id, down, distance)
-            plays.append(play)
-            
+        plays = self.allocate_plays(num_plays)
+        self.set_game_ids(plays, game_id, num_plays)
+        self.fill_plays(plays, 0, num_plays)
         return plays
     
     def generate_season_data(self, num_games=256):  # NFL regular season has 272 games (17 games * 32 teams / 2)
@@ -270,46 +387,47 @@ class NFLDataGenerator:
             num_games (int): Number of games to generate
             
         Returns:
-            list: List of all plays
+            dict: Play columns for all plays (see allocate_plays)
         """
-        all_plays = []
-        
         print(f"Generating data for {num_games} NFL games...")
-        for game_id in range(1, num_games + 1):
-            # Generate random number of plays per game (between 120-170)
-            num_plays = random.randint(120, 170)
-            game_plays = self.generate_game(game_id, num_plays)
-            all_plays.extend(game_plays)
-            
-            # Show progress
-            if game_id % 10 == 0 or game_id == num_games:
-                print(f"Generated {game_id} games ({len(all_plays)} plays)...")
+        
+        # Generate random number of plays per game (between 120-170) up front
+        # so the play columns can be allocated once
+        plays_per_game = self._rng.choices(range(120, 171), k=num_games)
+        total_plays = sum(plays_per_game)
+        plays = self.allocate_plays(total_plays)
+        
+        offset = 0
+        for game_id, num_plays in enumerate(plays_per_game, 1):
+            self.set_game_ids(plays, game_id, num_plays, offset)
+            offset += num_plays
+        
+        # Draw every play of the season in one batch
+        self.fill_plays(plays, 0, total_plays)
                 
-        print(f"Completed generating {len(all_plays)} plays across {num_games} games")
-        return all_plays
+        print(f"Completed generating {total_plays} plays across {num_games} games")
+        return plays
     
     def save_plays_to_csv(self, plays, filename='synthetic_pbp.csv'):
         """
         Save plays to a CSV file
         
         Args:
-            plays (list): List of play dictionaries
+            plays (dict): Play columns (see allocate_plays)
             filename (str): Output filename
         """
-        file_path = os.path.join(self.data_dir, filename)
+        if not plays or not len(plays['play_id']):
+            print("No plays to save")
+            return None
         
-        # Get all field names from the plays
-        fieldnames = set()
-        for play in plays:
-            fieldnames.update(play.keys())
-        fieldnames = sorted(list(fieldnames))
+        file_path = os.path.join(self.data_dir, filename)
         
         with open(file_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(plays)
+            writer = csv.writer(f)
+            writer.writerow(PLAY_COLUMNS)
+            writer.writerows(zip(*(plays[column] for column in PLAY_COLUMNS)))
             
-        print(f"Saved {len(plays)} plays to {file_path}")
+        print(f"Saved {len(plays['play_id'])} plays to {file_path}")
         return file_path
     
     def extract_play_tendencies(self, plays):
@@ -317,133 +435,159 @@ class NFLDataGenerator:
         Extract play-calling tendencies from play data
         
         Args:
-            plays (list): List of play dictionaries
+            plays (dict): Play columns (see allocate_plays)
             
         Returns:
             dict: Dictionary of play tendencies by down, distance, and field position
         """
-        # Group plays by down
-        plays_by_down = {}
-        for play in plays:
-            down = int(play['down'])
-            if down not in plays_by_down:
-                plays_by_down[down] = []
-            plays_by_down[down].append(play)
+        distance_ranges = [(1, 3), (4, 6), (7, 10), (11, 15), (16, 100)]
+        range_of_distance = {
+            distance: dist_range
+            for dist_range in distance_ranges
+            for distance in range(dist_range[0], dist_range[1] + 1)
+        }
+        
+        # Count plays by down, distance range and play type in a single pass
+        counts = Counter(
+            (down, range_of_distance.get(distance), play_type)
+            for down, distance, play_type in zip(plays['down'], plays['ydstogo'], plays['play_type'])
+        )
+        
+        # Sum the counts per down and per down/distance range
+        down_counts = {}
+        distance_counts = {}
+        for (down, dist_range, play_type), num_plays in counts.items():
+            down_counts.setdefault(down, Counter())[play_type] += num_plays
+            if dist_range is not None:
+                distance_counts.setdefault((down, dist_range), Counter())[play_type] += num_plays
         
         # Calculate tendencies
         tendencies = {}
         
         for down in range(1, 5):
-            if down not in plays_by_down:
+            if down not in down_counts:
                 continue
-                
-            down_plays = plays_by_down[down]
-            pass_plays = [p for p in down_plays if p['play_type'] == 'pass']
-            run_plays = [p for p in down_plays if p['play_type'] == 'run']
             
-            tendencies[down] = {
-                'total_plays': len(down_plays),
-                'pass_percentage': (len(pass_plays) / len(down_plays)) * 100,
-                'run_percentage': (len(run_plays) / len(down_plays)) * 100
-            }
+            tendencies[down] = self._play_count_summary(down_counts[down])
             
             # Add distance-based tendencies
-            distance_ranges = [(1, 3), (4, 6), (7, 10), (11, 15), (16, 100)]
-            
             for dist_min, dist_max in distance_ranges:
-                # Filter plays by distance
-                dist_plays = [p for p in down_plays if dist_min <= int(p['ydstogo']) <= dist_max]
-                
-                if not dist_plays:
+                if (down, (dist_min, dist_max)) not in distance_counts:
                     continue
-                    
-                dist_pass_plays = [p for p in dist_plays if p['play_type'] == 'pass']
-                dist_run_plays = [p for p in dist_plays if p['play_type'] == 'run']
                 
                 key = f"distance_{dist_min}_to_{dist_max}"
-                tendencies[down][key] = {
-                    'total_plays': len(dist_plays),
-                    'pass_percentage': (len(dist_pass_plays) / len(dist_plays)) * 100,
-                    'run_percentage': (len(dist_run_plays) / len(dist_plays)) * 100
-                }
+                tendencies[down][key] = self._play_count_summary(distance_counts[(down, (dist_min, dist_max))])
         
         return tendencies
     
+    @staticmethod
+    def _play_count_summary(counts):
+        """
+        Convert play counts by play type into a total and pass/run percentages
+        
+        Args:
+            counts (Counter): Play counts keyed by play type
+            
+        Returns:
+            dict: total_plays, pass_percentage and run_percentage
+        """
+        total = sum(counts.values())
+        return {
+            'total_plays': total,
+            'pass_percentage': (counts['pass'] / total) * 100,
+            'run_percentage': (counts['run'] / total) * 100
+        }
+    
     def extract_play_outcomes(self, plays):
         """
         Extract play outcome statistics (yards gained, etc.)
         
         Args:
-            plays (list): List of play dictionaries
+            plays (dict): Play columns (see allocate_plays)
             
         Returns:
             dict: Dictionary of play outcome statistics
         """
-        pass_plays = [p for p in plays if p['play_type'] == 'pass']
-        run_plays = [p for p in plays if p['play_type'] == 'run']
+        pass_yards = []
+        run_yards = []
+        for play_type, yards in zip(plays['play_type'], plays['yards_gained']):
+            if play_type == 'pass':
+                pass_yards.append(yards)
+            elif play_type == 'run':
+                run_yards.append(yards)
         
         outcomes = {}
         
-        # Process pass plays
-        if pass_plays:
-            pass_yards = [int(p['yards_gained']) for p in pass_plays]
-            
-            # Calculate yards distribution (limited to top 50 values)
-            yards_dist = {}
-            for yards in pass_yards:
-                if str(yards) not in yards_dist:
-                    yards_dist[str(yards)] = 0
-                yards_dist[str(yards)] += 1
-            
-            # Sort by frequency and limit to top 50
-            yards_dist = {k: v for k, v in sorted(yards_dist.items(), 
-                                                key=lambda x: int(x[1]), 
-                                                reverse=True)[:50]}
-            
-            outcomes['pass'] = {
-                'count': len(pass_plays),
-                'yards_mean': sum(pass_yards) / len(pass_yards),
-                'yards_median': sorted(pass_yards)[len(pass_yards) // 2],
-                'success_rate': (sum(1 for y in pass_yards if y > 0) / len(pass_yards)) * 100,
-                'yards_distribution': yards_dist
-            }
+        # Process pass and run plays
+        for play_type, yards in (('pass', pass_yards), ('run', run_yards)):
+            if yards:
+                outcomes[play_type] = self._summarize_yards(yards)
         
-        # Process run plays
-        if run_plays:
-            run_yards = [int(p['yards_gained']) for p in run_plays]
-            
-            # Calculate yards distribution (limited to top 50 values)
-            yards_dist = {}
-            for yards in run_yards:
-                if str(yards) not in yards_dist:
-                    yards_dist[str(yards)] = 0
-                yards_dist[str(yards)] += 1
-            
-            # Sort by frequency and limit to top 50
-            yards_dist = {k: v for k, v in sorted(yards_dist.items(), 
-                                                key=lambda x: int(x[1]), 
-                                                reverse=True)[:50]}
+        return outcomes
+    
+    @staticmethod
+    def _summarize_yards(yards):
+        """
+        Summarize yards gained for one play type
+        
+        All statistics come from a single histogram of the yards values, since
+        only about a hundred distinct values occur.
+        
+        Args:
+            yards (list): Yards gained for each play
             
-            outcomes['run'] = {
-                'count': len(run_plays),
-                'yards_mean': sum(run_yards) / len(run_plays),
-                'yards_median': sorted(run_yards)[len(run_yards) // 2],
-                'success_rate': (sum(1 for y in run_yards if y > 0) / len(run_plays)) * 100,
-                'yards_distribution': yards_dist
-            }
+        Returns:
+            dict: Count, mean, median, success rate and yards distribution
+        """
+        counts = Counter(yards)
+        total = len(yards)
         
-        return outcomes
+        # Median is the middle value of the sorted yards (upper middle for
+        # even counts); walk the sorted distinct values instead of sorting
+        # every play
+        median_rank = total // 2
+        seen = 0
+        for value in sorted(counts):
+            seen += counts[value]
+            if seen > median_rank:
+                median = value
+                break
+        
+        return {
+            'count': total,
+            'yards_mean': sum(value * count for value, count in counts.items()) / total,
+            'yards_median': median,
+            'success_rate': (sum(count for value, count in counts.items() if value > 0) / total) * 100,
+            # Calculate yards distribution (limited to top 50 values)
+            'yards_distribution': {str(k): v for k, v in counts.most_common(50)}
+        }
     
     def save_tendencies(self, tendencies, filename='play_tendencies.json'):
         """Save tendencies to a JSON file"""
         file_path = os.path.join(self.data_dir, filename)
-        with open(file_path, 'w') as f:
-            json.dump(tendencies, f, indent=2)
+        self._write_json(tendencies, file_path)
         print(f"Saved tendencies to {file_path}")
         
     def save_outcomes(self, outcomes, filename='play_outcomes.json'):
         """Save outcomes to a JSON file"""
         file_path = os.path.join(self.data_dir, filename)
-        with open(file_path, 'w') as f:
-            json.dump(outcomes, f, indent=2)
-        print(f"Saved outcomes to {file_path}")
\ No newline at end of file
+        self._write_json(outcomes, file_path)
+        print(f"Saved outcomes to {file_path}")
+    
+    def _write_json(self, data, file_path):
+        """
+        Write data to a compact JSON file, using orjson when it's installed
+        
+        Args:
+            data (dict): Data to save (int keys are written as strings)
+            file_path (str): Output file path
+        """
+        try:
+            import orjson
+        except ImportError:
+            with open(file_path, 'w') as f:
+                json.dump(data, f)
+            return
+        
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
\ No newline at end of file
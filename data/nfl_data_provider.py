@@ -6,13 +6,48 @@ This module loads NFL statistical data and provides access to it for simulations
 
 import os
 import json
+import pickle
 import random
+from bisect import bisect
+from itertools import accumulate
+
+# Fallback yards distributions (values, weights) if distribution data isn't available
+DEFAULT_YARDS_DISTRIBUTIONS = {
+    'pass': ([-5, -2, 0, 3, 7, 12, 20, 35], [5, 10, 30, 25, 15, 10, 4, 1]),
+    'run': ([-3, -1, 0, 1, 2, 3, 4, 8, 15, 25], [5, 7, 10, 15, 20, 20, 10, 8, 4, 1])
+}
+
+# Largest yards-to-go covered by the distance-based tendency lookup
+MAX_DISTANCE = 100
+
+# Binary cache of the parsed JSON data and lookup tables, kept in the data directory
+CACHE_FILENAME = 'play_tables.pickle'
+
+# Parsed data and lookup tables already loaded in this process, keyed by
+# (data directory, JSON modification times)
+_loaded_table_data = {}
+
+
+def default_yards_tables():
+    """
+    Build new yards sampling tables from DEFAULT_YARDS_DISTRIBUTIONS
+    
+    Returns:
+        dict: (values, cumulative weights) by play type
+    """
+    return {
+        play_type: (values, list(accumulate(weights)))
+        for play_type, (values, weights) in DEFAULT_YARDS_DISTRIBUTIONS.items()
+    }
 
 class NFLDataProvider:
     """
     Class for loading and providing NFL statistical data
     """
     
+    # Shared provider returned by get_default()
+    _default = None
+    
     def __init__(self, data_dir='data/nfl_data'):
         """
         Initialize the data provider
@@ -25,6 +60,25 @@ class NFLDataProvider:
         self.outcomes = {}
         self.loaded = False
         
+        # Yards sampling tables (values, cumulative weights) by play type
+        self._yards_tables = default_yards_tables()
+        
+        # Pass percentage lookup by down: (base percentage, percentage by distance)
+        self._pass_pcts = {}
+        
+    @classmethod
+    def get_default(cls):
+        """
+        Get a shared, loaded provider for the default data directory
+        
+        Returns:
+            NFLDataProvider: Provider instance shared by all callers
+        """
+        if cls._default is None:
+            cls._default = cls()
+            cls._default.load_data()
+        return cls._default
+    
     def load_data(self):
         """
         Load NFL statistical data from JSON files
@@ -33,15 +87,32 @@ class NFLDataProvider:
             bool: True if data was loaded successfully, False otherwise
         """
         try:
-            # Load play tendencies
             tendencies_path = os.path.join(self.data_dir, 'play_tendencies.json')
-            with open(tendencies_path, 'r') as f:
-                self.tendencies = json.load(f)
-            
-            # Load play outcomes
             outcomes_path = os.path.join(self.data_dir, 'play_outcomes.json')
-            with open(outcomes_path, 'r') as f:
-                self.outcomes = json.load(f)
+            
+            # Reuse data already loaded in this process, or the binary cache,
+            # if the JSON files haven't changed since
+            source_mtimes = (os.stat(tendencies_path).st_mtime_ns, os.stat(outcomes_path).st_mtime_ns)
+            key = (os.path.abspath(self.data_dir), source_mtimes)
+            
+            table_data = _loaded_table_data.get(key) or self._read_cache(source_mtimes)
+            if table_data is not None:
+                self._use_table_data(table_data)
+            else:
+                # Load play tendencies
+                self.tendencies = self._read_json(tendencies_path)
+                
+                # Load play outcomes
+                self.outcomes = self._read_json(outcomes_path)
+                
+                self._build_pass_tables()
+                self._build_yards_tables()
+                
+                table_data = self._table_data(source_mtimes)
+                self._write_cache(table_data)
+            
+            # Loaded data is never modified, so other providers can share it
+            _loaded_table_data[key] = table_data
                 
             self.loaded = True
             return True
@@ -50,6 +121,91 @@ class NFLDataProvider:
             print(f"Error loading NFL data: {str(e)}")
             return False
     
+    def _table_data(self, source_mtimes):
+        """
+        Collect the parsed data and lookup tables for caching
+        
+        Args:
+            source_mtimes (tuple): Modification times of the JSON files
+            
+        Returns:
+            dict: Parsed data and lookup tables
+        """
+        return {
+            'source_mtimes': source_mtimes,
+            'tendencies': self.tendencies,
+            'outcomes': self.outcomes,
+            'pass_pcts': self._pass_pcts,
+            'yards_tables': self._yards_tables
+        }
+    
+    def _use_table_data(self, table_data):
+        """
+        Use previously parsed data and lookup tables
+        
+        Args:
+            table_data (dict): Parsed data and lookup tables (see _table_data)
+        """
+        self.tendencies = table_data['tendencies']
+        self.outcomes = table_data['outcomes']
+        self._pass_pcts = table_data['pass_pcts']
+        self._yards_tables = table_data['yards_tables']
+    
+    def _read_cache(self, source_mtimes):
+        """
+        Read the parsed data and lookup tables from the binary cache
+        
+        Args:
+            source_mtimes (tuple): Modification times of the JSON files
+            
+        Returns:
+            dict: Parsed data and lookup tables, or None if there is no
+                up-to-date cache
+        """
+        try:
+            with open(os.path.join(self.data_dir, CACHE_FILENAME), 'rb') as f:
+                table_data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        
+        if table_data.get('source_mtimes') != source_mtimes:
+            return None
+        return table_data
+    
+    def _write_cache(self, table_data):
+        """
+        Write the parsed data and lookup tables to the binary cache
+        
+        Args:
+            table_data (dict): Parsed data and lookup tables (see _table_data)
+        """
+        # The cache is only an optimization, so a read-only data directory is fine
+        try:
+            with open(os.path.join(self.data_dir, CACHE_FILENAME), 'wb') as f:
+                pickle.dump(table_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    
+    def _read_json(self, file_path):
+        """
+        Read a JSON file, using orjson when it's installed
+        
+        Args:
+            file_path (str): Path to the JSON file
+            
+        Returns:
+            dict: Parsed JSON data
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        
+        try:
+            import orjson
+        except ImportError:
+            return json.loads(data)
+        
+        return orjson.loads(data)
+    
     def get_play_type(self, down, distance):
         """
         Determine play type (pass or run) based on statistical tendencies
@@ -64,62 +220,145 @@ class NFLDataProvider:
         if not self.loaded:
             self.load_data()
         
-        # Convert down to string for dictionary lookup
-        down_str = str(down)
+        return self._draw_play_type(down, distance)
+    
+    def sample_play(self, down, distance):
+        """
+        Determine play type and yards gained for a play in one call
         
+        Args:
+            down (int): Down (1-4)
+            distance (int): Yards to go
+            
+        Returns:
+            tuple: (play_type, yards_gained)
+        """
+        if not self.loaded:
+            self.load_data()
+        
+        play_type = self._draw_play_type(down, distance)
+        return play_type, self._draw_yards(play_type)
+    
+    def sample_plays(self, downs, distances):
+        """
+        Determine play types and yards gained for a batch of plays
+        
+        Args:
+            downs (list): Down (1-4) for each play
+            distances (list): Yards to go for each play
+            
+        Returns:
+            tuple: (play_types, yards_gained) lists
+        """
+        if not self.loaded:
+            self.load_data()
+        
+        rand = random.random
+        pass_pcts = self._pass_pcts
+        
+        # Randomly determine play types, collecting the plays of each type
+        play_types = []
+        indices_by_type = {'pass': [], 'run': []}
+        for i, (down, distance) in enumerate(zip(downs, distances)):
+            # Default to reasonable values if data isn't available
+            pass_pct = 50
+            if down in pass_pcts:
+                base_pct, distance_pcts = pass_pcts[down]
+                pass_pct = distance_pcts[distance] if 0 <= distance <= MAX_DISTANCE else base_pct
+            
+            play_type = 'pass' if rand() * 100 < pass_pct else 'run'
+            play_types.append(play_type)
+            indices_by_type[play_type].append(i)
+        
+        # Draw the yards for all plays of each play type in one call
+        yards_gained = [0] * len(play_types)
+        for play_type, indices in indices_by_type.items():
+            yards_values, cum_weights = self._yards_table(play_type)
+            drawn = random.choices(yards_values, cum_weights=cum_weights, k=len(indices))
+            for i, yards in zip(indices, drawn):
+                yards_gained[i] = yards
+        
+        return play_types, yards_gained
+    
+    def _draw_play_type(self, down, distance):
+        """
+        Randomly determine play type from the pass percentage for a down and distance
+        
+        Args:
+            down (int): Down (1-4)
+            distance (int): Yards to go
+            
+        Returns:
+            str: 'pass' or 'run'
+        """
         # Default to reasonable values if data isn't available
         pass_pct = 50
-        run_pct = 50
         
-        # Get base percentages for this down
-        if down_str in self.tendencies:
-            pass_pct = self.tendencies[down_str]['pass_percentage']
-            run_pct = self.tendencies[down_str]['run_percentage']
+        if down in self._pass_pcts:
+            base_pct, pass_pcts = self._pass_pcts[down]
+            pass_pct = pass_pcts[distance] if 0 <= distance <= MAX_DISTANCE else base_pct
+        
+        # Randomly determine play type based on percentages
+        if random.random() * 100 < pass_pct:
+            return 'pass'
+        else:
+            return 'run'
+    
+    def _build_pass_tables(self):
+        """
+        Resolve the down and distance-based tendencies into pass percentage lookups
+        
+        Each "distance_A_to_B" key is parsed once here, so drawing a play type
+        is a single list index instead of a scan over the tendency keys.
+        """
+        self._pass_pcts = {}
+        
+        for down_str, down_tendencies in self.tendencies.items():
+            try:
+                down = int(down_str)
+            except ValueError:
+                continue
+            
+            # Get base percentage for this down
+            base_pct = down_tendencies['pass_percentage']
+            pass_pcts = [base_pct] * (MAX_DISTANCE + 1)
             
-            # Look for more specific distance-based tendencies
-            for key in self.tendencies[down_str]:
+            # Fill in the more specific distance-based tendencies (in reverse,
+            # so the first matching range wins where ranges overlap)
+            for key in reversed(list(down_tendencies)):
                 if key.startswith('distance_'):
                     # Extract distance range from key (e.g., "distance_1_to_3")
                     parts = key.split('_')
                     if len(parts) >= 4:
                         try:
-                            min_dist = int(parts[1])
-                            max_dist = int(parts[3])
-                            if min_dist <= distance <= max_dist:
-                                pass_pct = self.tendencies[down_str][key]['pass_percentage']
-                                run_pct = self.tendencies[down_str][key]['run_percentage']
-                                break
+                            min_dist = max(0, int(parts[1]))
+                            max_dist = min(MAX_DISTANCE, int(parts[3]))
                         except (ValueError, IndexError):
                             continue
-        
-        # Randomly determine play type based on percentages
-        if random.random() * 100 < pass_pct:
-            return 'pass'
-        else:
-            return 'run'
+                        
+                        dist_pct = down_tendencies[key]['pass_percentage']
+                        pass_pcts[min_dist:max_dist + 1] = [dist_pct] * max(0, max_dist - min_dist + 1)
+            
+            self._pass_pcts[down] = (base_pct, pass_pcts)
     
-    def get_yards_gained(self, play_type):
+    def _build_yards_tables(self):
         """
-        Determine yards gained for a play based on statistical distributions
+        Parse the yards distributions from the outcomes data into sampling tables
         
-        Args:
-            play_type (str): 'pass' or 'run'
-            
-        Returns:
-            int: Yards gained
+        The tables are built in a new dict (starting from the defaults), since
+        the previous one may be shared with other providers.
         """
-        if not self.loaded:
-            self.load_data()
+        self._yards_tables = default_yards_tables()
         
-        # Get yard distribution for this play type
-        if play_type in self.outcomes and 'yards_distribution' in self.outcomes[play_type]:
-            dist = self.outcomes[play_type]['yards_distribution']
+        for play_type, outcome in self.outcomes.items():
+            if 'yards_distribution' not in outcome:
+                continue
             
             # Convert keys to integers and create a weighted distribution
             yards_values = []
             weights = []
             
-            for yards_str, count in dist.items():
+            for yards_str, count in outcome['yards_distribution'].items():
                 try:
                     yards = int(yards_str)
                     yards_values.append(yards)
@@ -128,19 +367,49 @@ class NFLDataProvider:
                     continue
             
             if yards_values:
-                # Choose a yard value based on weighted distribution
-                return random.choices(yards_values, weights=weights, k=1)[0]
-        
-        # Fallback to reasonable defaults if distribution data isn't available
-        if play_type == 'pass':
-            return random.choices(
-                [-5, -2, 0, 3, 7, 12, 20, 35],
-                weights=[5, 10, 30, 25, 15, 10, 4, 1],
-                k=1
-            )[0]
-        else:  # run
-            return random.choices(
-                [-3, -1, 0, 1, 2, 3, 4, 8, 15, 25],
-                weights=[5, 7, 10, 15, 20, 20, 10, 8, 4, 1],
-                k=1
-            )[0]
\ No newline at end of file
+                self._yards_tables[play_type] = (yards_values, list(accumulate(weights)))
+    
+    def get_yards_gained(self, play_type):
+        """
+        Determine yards gained for a play based on statistical distributions
+        
+        Args:
+            play_type (str): 'pass' or 'run'
+            
+        Returns:
+            int: Yards gained
+        """
+        if not self.loaded:
+            self.load_data()
+        
+        return self._draw_yards(play_type)
+    
+    def _draw_yards(self, play_type):
+        """
+        Draw yards gained for a play type from its sampling table
+        
+        Args:
+            play_type (str): 'pass' or 'run'
+            
+        Returns:
+            int: Yards gained
+        """
+        # One random number per play, so the yards follow the current state
+        # of the random module (e.g. after random.seed)
+        yards_values, cum_weights = self._yards_table(play_type)
+        return yards_values[bisect(cum_weights, random.random() * cum_weights[-1])]
+    
+    def _yards_table(self, play_type):
+        """
+        Get the yards sampling table for a play type
+        
+        Args:
+            play_type (str): 'pass' or 'run'
+            
+        Returns:
+            tuple: (yards values, cumulative weights)
+        """
+        # Anything other than a pass falls back to the run distribution
+        return self._yards_tables.get(play_type) or (
+            self._yards_tables['pass' if play_type == 'pass' else 'run']
+        )
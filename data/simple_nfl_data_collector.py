@@ -11,8 +11,37 @@ import csv
 import urllib.request
 from urllib.error import URLError
 import gzip
-import shutil
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+# Play-by-play fields kept when reading a CSV (used by the extractors and the
+# setup script's sample play); pbp files have hundreds of other columns
+PLAY_FIELDS = ('play_id', 'play_type', 'down', 'ydstogo', 'yards_gained')
+
+
+def parse_int(value):
+    """Parse a CSV value as a whole number (None if missing or not numeric)"""
+    if type(value) is int:
+        return value
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_float(value):
+    """Parse a CSV value as a float (None if missing or not numeric)"""
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Numeric play fields, parsed once when a CSV is read
+NUMERIC_FIELDS = {'down': parse_int, 'ydstogo': parse_int, 'yards_gained': parse_float}
+
 
 class SimpleNFLDataCollector:
     """
@@ -29,8 +58,7 @@ class SimpleNFLDataCollector:
         self.data_dir = data_dir
         
         # Create data directory if it doesn't exist
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        os.makedirs(data_dir, exist_ok=True)
     
     def download_season_data(self, season):
         """
@@ -44,25 +72,21 @@ class SimpleNFLDataCollector:
         """
         print(f"Downloading NFL play-by-play data for {season} season...")
         
-        # File paths
+        # File path (the CSV is read straight from the gzipped download)
         gz_file = os.path.join(self.data_dir, f"pbp_{season}.csv.gz")
-        csv_file = os.path.join(self.data_dir, f"pbp_{season}.csv")
         
         # URL for NFL data (from nflverse GitHub repository)
         url = f"https://github.com/nflverse/nflfastR-data/raw/master/data/play_by_play_{season}.csv.gz"
         
         try:
-            # Download the gzipped file
+            # Download the gzipped file (to a temporary name first, so an
+            # interrupted download isn't mistaken for a local copy later)
             print(f"Downloading from {url}...")
-            urllib.request.urlretrieve(url, gz_file)
-            
-            # Uncompress the gzipped file
-            with gzip.open(gz_file, 'rb') as f_in:
-                with open(csv_file, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+            urllib.request.urlretrieve(url, gz_file + '.part')
+            os.replace(gz_file + '.part', gz_file)
             
             # Read the CSV file
-            plays = self.read_csv_to_dict(csv_file)
+            plays = self.read_csv_to_dict(gz_file)
             print(f"Successfully downloaded {len(plays)} plays from {season}")
             
             return plays
@@ -74,22 +98,46 @@ class SimpleNFLDataCollector:
             print(f"Error processing {season} data: {str(e)}")
             return None
     
-    def read_csv_to_dict(self, csv_file):
+    def read_csv_to_dict(self, csv_file, fields=PLAY_FIELDS):
         """
         Read a CSV file into a list of dictionaries
         
         Args:
-            csv_file (str): Path to CSV file
+            csv_file (str): Path to CSV file (may be gzipped, ending in .gz)
+            fields (tuple): Columns to keep in each row (None keeps every column)
             
         Returns:
-            list: List of dictionaries, one per row
+            list: List of dictionaries, one per row (kept numeric fields are
+                parsed to numbers, or None if missing)
         """
-        plays = []
+        # Gzipped files are decompressed while reading
+        open_file = gzip.open if csv_file.endswith('.gz') else open
         
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                plays.append(row)
+        with open_file(csv_file, 'rt', encoding='utf-8') as f:
+            if fields is None:
+                return list(csv.DictReader(f))
+            
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return []
+            
+            # Pick the kept columns out of each row by position
+            names = [field for field in fields if field in header]
+            if not names:
+                return [{} for _ in reader]
+            indices = [header.index(name) for name in names]
+            if len(indices) == 1:
+                plays = [{names[0]: row[indices[0]]} for row in reader]
+            else:
+                get_fields = itemgetter(*indices)
+                plays = [dict(zip(names, get_fields(row))) for row in reader]
+        
+        # Parse numeric fields once here rather than in every extractor
+        for field, parse in NUMERIC_FIELDS.items():
+            if field in names:
+                for play in plays:
+                    play[field] = parse(play[field])
         
         return plays
     
@@ -104,11 +152,15 @@ class SimpleNFLDataCollector:
             list: List of play dictionaries
         """
         csv_file = os.path.join(self.data_dir, f"pbp_{season}.csv")
+        gz_file = os.path.join(self.data_dir, f"pbp_{season}.csv.gz")
         
-        # Check if we already have the data locally
+        # Check if we already have the data locally (uncompressed or as downloaded)
         if os.path.exists(csv_file):
             print(f"Loading {season} data from local file...")
             return self.read_csv_to_dict(csv_file)
+        elif os.path.exists(gz_file):
+            print(f"Loading {season} data from local file...")
+            return self.read_csv_to_dict(gz_file)
         else:
             # Download if we don't have it
             return self.download_season_data(season)
@@ -123,77 +175,73 @@ class SimpleNFLDataCollector:
         Returns:
             dict: Dictionary of play tendencies by down, distance, and field position
         """
-        # Filter to only include offensive plays (no kickoffs, punts, etc)
-        offensive_plays = [p for p in plays if p.get('play_type') in ['pass', 'run']]
+        distance_ranges = [(1, 3), (4, 6), (7, 10), (11, 15), (16, 100)]
+        range_of_distance = {
+            distance: dist_range
+            for dist_range in distance_ranges
+            for distance in range(dist_range[0], dist_range[1] + 1)
+        }
         
-        # Group plays by down
-        plays_by_down = defaultdict(list)
-        for play in offensive_plays:
-            try:
-                down = int(play.get('down', 0))
-                if down > 0:
-                    plays_by_down[down].append(play)
-            except (ValueError, TypeError):
+        # Count offensive plays (no kickoffs, punts, etc) by down, distance
+        # range and play type in a single pass
+        counts = defaultdict(int)
+        for play in plays:
+            play_type = play.get('play_type')
+            if play_type not in ('pass', 'run'):
+                continue
+            
+            down = parse_int(play.get('down', 0))
+            if down is None:
                 continue
+            
+            dist_range = range_of_distance.get(parse_int(play.get('ydstogo', 0)))
+            
+            counts[(down, dist_range, play_type)] += 1
+        
+        # Sum the counts per down and per down/distance range
+        down_counts = defaultdict(lambda: defaultdict(int))
+        distance_counts = defaultdict(lambda: defaultdict(int))
+        for (down, dist_range, play_type), num_plays in counts.items():
+            down_counts[down][play_type] += num_plays
+            if dist_range is not None:
+                distance_counts[(down, dist_range)][play_type] += num_plays
         
         # Calculate tendencies
         tendencies = {}
         
         for down in range(1, 5):
-            down_plays = plays_by_down.get(down, [])
-            
             # Skip if no plays for this down
-            if not down_plays:
+            if down not in down_counts:
                 continue
             
-            # Count play types
-            pass_plays = sum(1 for p in down_plays if p.get('play_type') == 'pass')
-            run_plays = sum(1 for p in down_plays if p.get('play_type') == 'run')
-            total_plays = pass_plays + run_plays
-            
-            if total_plays == 0:
-                continue
-                
-            tendencies[down] = {
-                'total_plays': total_plays,
-                'pass_percentage': (pass_plays / total_plays) * 100,
-                'run_percentage': (run_plays / total_plays) * 100
-            }
-            
-            # Group by distance ranges
-            distance_ranges = [(1, 3), (4, 6), (7, 10), (11, 15), (16, 100)]
+            tendencies[down] = self._play_count_summary(down_counts[down])
             
             for dist_min, dist_max in distance_ranges:
-                # Filter plays by distance
-                dist_plays = []
-                for play in down_plays:
-                    try:
-                        yards_to_go = int(float(play.get('ydstogo', 0)))
-                        if dist_min <= yards_to_go <= dist_max:
-                            dist_plays.append(play)
-                    except (ValueError, TypeError):
-                        continue
-                
-                if not dist_plays:
-                    continue
-                
-                # Count play types within this distance range
-                pass_plays = sum(1 for p in dist_plays if p.get('play_type') == 'pass')
-                run_plays = sum(1 for p in dist_plays if p.get('play_type') == 'run')
-                total_plays = pass_plays + run_plays
-                
-                if total_plays == 0:
+                if (down, (dist_min, dist_max)) not in distance_counts:
                     continue
                     
                 key = f"distance_{dist_min}_to_{dist_max}"
-                tendencies[down][key] = {
-                    'total_plays': total_plays,
-                    'pass_percentage': (pass_plays / total_plays) * 100,
-                    'run_percentage': (run_plays / total_plays) * 100
-                }
+                tendencies[down][key] = self._play_count_summary(distance_counts[(down, (dist_min, dist_max))])
         
         return tendencies
     
+    def _play_count_summary(self, counts):
+        """
+        Convert pass/run play counts into a total and percentages
+        
+        Args:
+            counts (dict): Play counts keyed by 'pass' and 'run'
+            
+        Returns:
+            dict: total_plays, pass_percentage and run_percentage
+        """
+        total_plays = counts['pass'] + counts['run']
+        return {
+            'total_plays': total_plays,
+            'pass_percentage': (counts['pass'] / total_plays) * 100,
+            'run_percentage': (counts['run'] / total_plays) * 100
+        }
+    
     def extract_play_outcomes(self, plays):
         """
         Extract play outcome statistics (yards gained, etc.)
@@ -204,98 +252,91 @@ class SimpleNFLDataCollector:
         Returns:
             dict: Dictionary of play outcome statistics
         """
-        # Filter to only include offensive plays
-        pass_plays = [p for p in plays if p.get('play_type') == 'pass']
-        run_plays = [p for p in plays if p.get('play_type') == 'run']
+        # Collect yards gained for each offensive play type in a single pass
+        yards_by_type = {'pass': [], 'run': []}
+        for play in plays:
+            yards_gained = yards_by_type.get(play.get('play_type'))
+            if yards_gained is None:
+                continue
+            yards = parse_float(play.get('yards_gained', 0))
+            if yards is not None:
+                yards_gained.append(yards)
         
         outcomes = {}
         
-        # Process pass plays
-        if pass_plays:
-            # Extract yards gained
-            yards_gained = []
-            for play in pass_plays:
-                try:
-                    yards = float(play.get('yards_gained', 0))
-                    yards_gained.append(yards)
-                except (ValueError, TypeError):
-                    continue
-            
+        # Process pass and run plays
+        for play_type, yards_gained in yards_by_type.items():
             if yards_gained:
-                # Sort yards for calculating median
-                sorted_yards = sorted(yards_gained)
-                median_idx = len(sorted_yards) // 2
-                
-                # Calculate yards distribution
-                yards_dist = defaultdict(int)
-                for yards in yards_gained:
-                    yards_dist[int(yards)] += 1
-                
-                # Convert to dictionary with string keys (for JSON)
-                yards_dist_dict = {str(k): v for k, v in sorted(yards_dist.items(), 
-                                                              key=lambda x: x[1], 
-                                                              reverse=True)[:50]}
-                
-                # Calculate success rate (positive yards)
-                success_count = sum(1 for y in yards_gained if y > 0)
-                
-                outcomes['pass'] = {
-                    'count': len(yards_gained),
-                    'yards_mean': sum(yards_gained) / len(yards_gained),
-                    'yards_median': sorted_yards[median_idx],
-                    'success_rate': (success_count / len(yards_gained)) * 100,
-                    'yards_distribution': yards_dist_dict
-                }
+                outcomes[play_type] = self._summarize_yards(yards_gained)
         
-        # Process run plays
-        if run_plays:
-            # Extract yards gained
-            yards_gained = []
-            for play in run_plays:
-                try:
-                    yards = float(play.get('yards_gained', 0))
-                    yards_gained.append(yards)
-                except (ValueError, TypeError):
-                    continue
+        return outcomes
+    
+    def _summarize_yards(self, yards_gained):
+        """
+        Calculate outcome statistics for the yards gained on one play type
+        
+        Args:
+            yards_gained (list): Yards gained (floats) for each play
             
-            if yards_gained:
-                # Sort yards for calculating median
-                sorted_yards = sorted(yards_gained)
-                median_idx = len(sorted_yards) // 2
-                
-                # Calculate yards distribution
-                yards_dist = defaultdict(int)
-                for yards in yards_gained:
-                    yards_dist[int(yards)] += 1
-                
-                # Convert to dictionary with string keys (for JSON)
-                yards_dist_dict = {str(k): v for k, v in sorted(yards_dist.items(), 
-                                                              key=lambda x: x[1], 
-                                                              reverse=True)[:50]}
-                
-                # Calculate success rate (positive yards)
-                success_count = sum(1 for y in yards_gained if y > 0)
-                
-                outcomes['run'] = {
-                    'count': len(yards_gained),
-                    'yards_mean': sum(yards_gained) / len(yards_gained),
-                    'yards_median': sorted_yards[median_idx],
-                    'success_rate': (success_count / len(yards_gained)) * 100,
-                    'yards_distribution': yards_dist_dict
-                }
+        Returns:
+            dict: Count, mean, median, success rate and yards distribution
+        """
+        # Find the median (middle value, upper middle for even counts) from
+        # the distinct yards values rather than sorting every play
+        yards_counts = Counter(yards_gained)
+        median_idx = len(yards_gained) // 2
+        seen = 0
+        for yards in sorted(yards_counts):
+            seen += yards_counts[yards]
+            if seen > median_idx:
+                median = yards
+                break
         
-        return outcomes
+        # Calculate yards distribution (whole yards) from the value counts
+        yards_dist = Counter()
+        for yards, count in yards_counts.items():
+            yards_dist[int(yards)] += count
+        
+        # Convert to dictionary with string keys (for JSON)
+        yards_dist_dict = {str(k): v for k, v in yards_dist.most_common(50)}
+        
+        # Calculate success rate (positive yards)
+        success_count = sum(count for yards, count in yards_counts.items() if yards > 0)
+        
+        return {
+            'count': len(yards_gained),
+            'yards_mean': sum(yards_gained) / len(yards_gained),
+            'yards_median': median,
+            'success_rate': (success_count / len(yards_gained)) * 100,
+            'yards_distribution': yards_dist_dict
+        }
     
     def save_tendencies(self, tendencies, filename='play_tendencies.json'):
         """Save tendencies to a JSON file"""
         file_path = os.path.join(self.data_dir, filename)
-        with open(file_path, 'w') as f:
-            json.dump(tendencies, f, indent=2)
+        self._write_json(tendencies, file_path)
         print(f"Saved tendencies to {file_path}")
         
     def save_outcomes(self, outcomes, filename='play_outcomes.json'):
         """Save outcomes to a JSON file"""
         file_path = os.path.join(self.data_dir, filename)
-        with open(file_path, 'w') as f:
-            json.dump(outcomes, f, indent=2)
-        print(f"Saved outcomes to {file_path}")
\ No newline at end of file
+        self._write_json(outcomes, file_path)
+        print(f"Saved outcomes to {file_path}")
+    
+    def _write_json(self, data, file_path):
+        """
+        Write data to an indented JSON file, using orjson when it's installed
+        
+        Args:
+            data (dict): Data to save (int keys are written as strings)
+            file_path (str): Output file path
+        """
+        try:
+            import orjson
+        except ImportError:
+            with open(file_path, 'w') as f:
+                json.dump(data, f, indent=2)
+            return
+        
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
\ No newline at end of file
@@ -4,6 +4,7 @@ from data_processing.data_analysis import PlayByPlayAnalyzer
 from data_processing.data_export import DataExporter
 import pandas as pd
 import os
+import logging
 
 def run_data_pipeline_example():
     """
@@ -100,4 +101,5 @@ def run_data_pipeline_example():
     print("The exported data can now be used to make the simulation more realistic.")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     run_data_pipeline_example()
\ No newline at end of file
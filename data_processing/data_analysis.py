@@ -2,8 +2,6 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 class PlayByPlayAnalyzer:
     """
@@ -11,13 +9,25 @@ class PlayByPlayAnalyzer:
     for use in the simulation engine.
     """
     
+    # Low-cardinality string columns stored as categoricals (integer codes)
+    CATEGORY_COLUMNS = ['play_type', 'posteam', 'defteam']
+    
     def __init__(self, pbp_data: Optional[pd.DataFrame] = None):
         """Initialize with optional play-by-play data."""
-        self.pbp_data = pbp_data
+        self.pbp_data = None
+        if pbp_data is not None:
+            self.load_data(pbp_data)
     
     def load_data(self, pbp_data: pd.DataFrame):
         """Load play-by-play data for analysis."""
-        self.pbp_data = pbp_data
+        # Convert team and play type columns to categoricals (without
+        # modifying the caller's DataFrame)
+        to_convert = {
+            col: pbp_data[col].astype('category')
+            for col in self.CATEGORY_COLUMNS
+            if col in pbp_data.columns and not isinstance(pbp_data[col].dtype, pd.CategoricalDtype)
+        }
+        self.pbp_data = pbp_data.assign(**to_convert) if to_convert else pbp_data
     
     def analyze_play_calling(self, team: Optional[str] = None) -> pd.DataFrame:
         """
@@ -33,8 +43,8 @@ class PlayByPlayAnalyzer:
             print("No data loaded. Please load data first.")
             return pd.DataFrame()
         
-        # Create a copy to avoid modifying the original
-        df = self.pbp_data.copy()
+        # Work on the loaded data directly (nothing below modifies it)
+        df = self.pbp_data
         
         # Filter by team if specified
         if team:
@@ -48,15 +58,17 @@ class PlayByPlayAnalyzer:
         
         # Group by down, distance buckets, and play type
         try:
-            # Create distance buckets
-            df['distance_bucket'] = pd.cut(
+            # Create distance buckets (as a separate Series, not a new column)
+            distance_bucket = pd.cut(
                 df['ydstogo'], 
                 bins=[0, 2, 5, 10, 15, 100],
                 labels=['Short (1-2)', 'Medium (3-5)', 'Standard (6-10)', 'Long (11-15)', 'Very Long (16+)']
-            )
+            ).rename('distance_bucket')
             
             # Group and calculate percentages
-            play_call_counts = df.groupby(['down', 'distance_bucket', 'play_type']).size().unstack(fill_value=0)
+            play_call_counts = df.groupby(
+                [df['down'], distance_bucket, df['play_type']], observed=True
+            ).size().unstack(fill_value=0)
             play_call_pct = play_call_counts.div(play_call_counts.sum(axis=1), axis=0) * 100
             
             return play_call_pct.round(2)
@@ -78,9 +90,8 @@ class PlayByPlayAnalyzer:
             print("No data loaded. Please load data first.")
             return {}
         
-        # Create a copy and filter to the play type
-        df = self.pbp_data.copy()
-        df = df[df['play_type'] == play_type]
+        # Filter to the play type
+        df = self.pbp_data.loc[self.pbp_data['play_type'] == play_type]
         
         # Check if we have yards gained column
         if 'yards_gained' not in df.columns:
@@ -89,17 +100,45 @@ class PlayByPlayAnalyzer:
         
         # Calculate statistics
         try:
+            # Work on the yards array once (NaN yards are skipped, as pandas does)
+            yards = df['yards_gained'].to_numpy(dtype=float, na_value=np.nan)
+            valid_yards = yards[~np.isnan(yards)]
+            
+            success_rate = np.nan
+            if len(yards):
+                success_rate = (yards >= df['ydstogo'].to_numpy(dtype=float, na_value=np.nan)).mean() * 100
+            
+            if len(valid_yards):
+                # One call for all three quantiles
+                percentile_25, median, percentile_75 = np.percentile(valid_yards, [25, 50, 75])
+                yards_min, yards_max = valid_yards.min(), valid_yards.max()
+                yards_mean = valid_yards.mean()
+                yards_std = valid_yards.std(ddof=1) if len(valid_yards) > 1 else np.nan
+            else:
+                percentile_25 = median = percentile_75 = np.nan
+                yards_min = yards_max = yards_mean = yards_std = np.nan
+            
+            # Touchdown/turnover rates from the flag arrays (None if the column is missing)
+            flag_rates = {}
+            for col in ['touchdown', 'turnover']:
+                if col not in df.columns:
+                    flag_rates[col] = None
+                    continue
+                flags = df[col].to_numpy(dtype=float, na_value=np.nan)
+                flags = flags[~np.isnan(flags)]
+                flag_rates[col] = flags.mean() * 100 if len(flags) else np.nan
+            
             stats = {
-                'mean': df['yards_gained'].mean(),
-                'median': df['yards_gained'].median(),
-                'std': df['yards_gained'].std(),
-                'min': df['yards_gained'].min(),
-                'max': df['yards_gained'].max(),
-                'percentile_25': df['yards_gained'].quantile(0.25),
-                'percentile_75': df['yards_gained'].quantile(0.75),
-                'success_rate': (df['yards_gained'] >= df['ydstogo']).mean() * 100,
-                'touchdown_rate': df['touchdown'].mean() * 100 if 'touchdown' in df.columns else None,
-                'turnover_rate': df['turnover'].mean() * 100 if 'turnover' in df.columns else None,
+                'mean': yards_mean,
+                'median': median,
+                'std': yards_std,
+                'min': yards_min,
+                'max': yards_max,
+                'percentile_25': percentile_25,
+                'percentile_75': percentile_75,
+                'success_rate': success_rate,
+                'touchdown_rate': flag_rates['touchdown'],
+                'turnover_rate': flag_rates['turnover'],
                 'sample_size': len(df)
             }
             
@@ -128,6 +167,10 @@ class PlayByPlayAnalyzer:
             print(f"No data for play type: {play_type}")
             return
         
+        # Import plotting packages here so they're only needed when plotting
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         # Create the plot
         plt.figure(figsize=(10, 6))
         sns.histplot(df['yards_gained'], kde=True, bins=30)
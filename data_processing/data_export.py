@@ -1,21 +1,79 @@
 # data_processing/data_export.py
 import pandas as pd
+import base64
+import contextlib
+import io
 import json
+import logging
 import os
+import pathlib
 import numpy as np
 from typing import Dict, List, Any, Optional
 import pickle
+import csv
+import struct
+import time
+
+log = logging.getLogger(__name__)
+
+# Rows formatted and written per chunk by the numeric CSV writer
+CSV_CHUNK_ROWS = 65536
+
+# Frames with more rows than this are written with polars' multithreaded CSV
+# writer when it's installed
+POLARS_CSV_MIN_ROWS = 50_000
+
+# Buffer size for export files, so many small writes reach the disk as few
+# large ones
+WRITE_BUFFER_SIZE = 1 << 20
+
+# zstd level used for compressed CSV/JSON exports
+ZSTD_LEVEL = 3
+
+# Byte-length prefix for each out-of-band buffer in a model's .buffers file
+BUFFER_LENGTH = struct.Struct('<Q')
 
 # Custom JSON encoder to handle NumPy data types
 class NumpyEncoder(json.JSONEncoder):
+    # Converter for each NumPy type, looked up by exact type (other NumPy
+    # integer/float types are added the first time they're seen)
+    _DISPATCH = {
+        **dict.fromkeys((np.int8, np.int16, np.int32, np.int64,
+                         np.uint8, np.uint16, np.uint32, np.uint64), int),
+        **dict.fromkeys((np.float16, np.float32, np.float64), float),
+        np.ndarray: np.ndarray.tolist,
+    }
+    
+    # Arrays bigger than this (in bytes) are written as base64 when
+    # binary_arrays is set
+    BINARY_ARRAY_MIN_BYTES = 4096
+    
+    def __init__(self, *args, binary_arrays: bool = False, **kwargs):
+        super(NumpyEncoder, self).__init__(*args, **kwargs)
+        self.binary_arrays = binary_arrays
+    
     def default(self, obj):
-        if isinstance(obj, (np.integer, np.int64)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64)):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return super(NumpyEncoder, self).default(obj)
+        # Large arrays become {"__ndarray__": base64 data, "dtype", "shape"}
+        # (read back with DataImporter.decode_ndarray) instead of nested lists
+        if (self.binary_arrays and isinstance(obj, np.ndarray)
+                and obj.nbytes > self.BINARY_ARRAY_MIN_BYTES and not obj.dtype.hasobject):
+            return {
+                "__ndarray__": base64.b64encode(np.ascontiguousarray(obj).tobytes()).decode('ascii'),
+                "dtype": obj.dtype.str,
+                "shape": list(obj.shape)
+            }
+        
+        convert = self._DISPATCH.get(type(obj))
+        if convert is None:
+            if isinstance(obj, np.integer):
+                convert = self._DISPATCH[type(obj)] = int
+            elif isinstance(obj, np.floating):
+                convert = self._DISPATCH[type(obj)] = float
+            elif isinstance(obj, np.ndarray):
+                convert = self._DISPATCH[type(obj)] = np.ndarray.tolist
+            else:
+                return super(NumpyEncoder, self).default(obj)
+        return convert(obj)
 
 class DataExporter:
     """
@@ -24,81 +82,329 @@ class DataExporter:
     
     def __init__(self, output_dir: str = "results"):
         """Initialize with path to output directory."""
-        self.output_dir = output_dir
+        self.output_dir = pathlib.Path(output_dir)
         
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _resolve(self, filename: str, ext: str) -> str:
+        """
+        Get the output path for a file, adding the extension if it's missing.
+        
+        Args:
+            filename: Name of the output file
+            ext: Expected file extension (e.g. '.csv')
+            
+        Returns:
+            Full path of the output file
+        """
+        return str(self.output_dir / (filename if filename.endswith(ext) else f"{filename}{ext}"))
     
-    def export_csv(self, data: pd.DataFrame, filename: str, **kwargs) -> str:
+    @contextlib.contextmanager
+    def _atomic_open(self, output_path: str, mode: str = 'wb', **kwargs):
+        """
+        Open a temporary file that replaces output_path once fully written,
+        so a failed export never leaves a partial file behind.
+        
+        Args:
+            output_path: Path of the output file
+            mode: File mode ('w' or 'wb')
+            **kwargs: Additional arguments to pass to open
+            
+        Yields:
+            The open temporary file
+        """
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, mode, buffering=WRITE_BUFFER_SIZE, **kwargs) as f:
+                yield f
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def export_dataframe(self, data: pd.DataFrame, filename: str, format: str = "parquet", **kwargs) -> str:
+        """
+        Export DataFrame as Parquet (default), Feather or CSV.
+        
+        Args:
+            data: DataFrame to export
+            filename: Name of the output file
+            format: One of 'parquet', 'feather' or 'csv'
+            **kwargs: Additional arguments to pass to the pandas writer
+            
+        Returns:
+            Path to the exported file
+        """
+        if format == "parquet":
+            return self.export_parquet(data, filename, **kwargs)
+        elif format == "feather":
+            return self.export_feather(data, filename, **kwargs)
+        elif format == "csv":
+            return self.export_csv(data, filename, **kwargs)
+        
+        log.error(f"Error exporting data: unsupported format '{format}'")
+        return ""
+    
+    def export_parquet(self, data: pd.DataFrame, filename: str, **kwargs) -> str:
+        """
+        Export DataFrame to Parquet (Snappy-compressed, via pyarrow).
+        
+        Args:
+            data: DataFrame to export
+            filename: Name of the output file
+            **kwargs: Additional arguments to pass to DataFrame.to_parquet
+            
+        Returns:
+            Path to the exported file
+        """
+        output_path = self._resolve(filename, '.parquet')
+        
+        kwargs.setdefault('engine', 'pyarrow')
+        kwargs.setdefault('compression', 'snappy')
+        
+        try:
+            with self._atomic_open(output_path) as f:
+                data.to_parquet(f, **kwargs)
+            log.info(f"Data exported to {output_path}")
+            return output_path
+        except Exception as e:
+            log.error(f"Error exporting Parquet: {e}")
+            return ""
+    
+    def export_feather(self, data: pd.DataFrame, filename: str, **kwargs) -> str:
+        """
+        Export DataFrame to Feather (zstd-compressed, via pyarrow).
+        
+        Args:
+            data: DataFrame to export
+            filename: Name of the output file
+            **kwargs: Additional arguments to pass to DataFrame.to_feather
+            
+        Returns:
+            Path to the exported file
+        """
+        output_path = self._resolve(filename, '.feather')
+        
+        kwargs.setdefault('compression', 'zstd')
+        
+        try:
+            with self._atomic_open(output_path) as f:
+                data.to_feather(f, **kwargs)
+            log.info(f"Data exported to {output_path}")
+            return output_path
+        except Exception as e:
+            log.error(f"Error exporting Feather: {e}")
+            return ""
+    
+    def export_csv(self, data: pd.DataFrame, filename: str, format: str = "csv", **kwargs) -> str:
         """
         Export DataFrame to CSV.
         
+        Frames over POLARS_CSV_MIN_ROWS rows with only integer and string
+        columns, written with index=False, use polars' writer when it's
+        installed (the output is the same as to_csv's).
+        
         Args:
             data: DataFrame to export
             filename: Name of the output file
+            format: Export format; 'parquet' or 'feather' delegate to export_dataframe
             **kwargs: Additional arguments to pass to DataFrame.to_csv
+                (compression='zstd' writes a '.csv.zst' file)
             
         Returns:
             Path to the exported file
         """
-        # Make sure filename has .csv extension
-        if not filename.endswith('.csv'):
-            filename = f"{filename}.csv"
+        if format != "csv":
+            return self.export_dataframe(data, filename, format=format, **kwargs)
+        
+        output_path = self._resolve(filename, '.csv')
+        if kwargs.get('compression') == 'zstd':
+            kwargs['compression'] = {'method': 'zstd', 'level': ZSTD_LEVEL}
+            output_path = f"{output_path}.zst"
         
-        # Create full path
-        output_path = os.path.join(self.output_dir, filename)
+        # All-numeric frames (with only the index option given) skip the
+        # generic per-cell to_csv formatting; a written index must be numeric
+        # too, since other index values may need quoting or to_csv's own
+        # formatting (e.g. dates)
+        def is_numeric(dtype):
+            return isinstance(dtype, np.dtype) and np.issubdtype(dtype, np.number)
+        
+        numeric = (
+            set(kwargs) <= {'index'}
+            and (not kwargs.get('index', True) or (
+                not isinstance(data.index, pd.MultiIndex) and is_numeric(data.index.dtype)
+            ))
+            and all(is_numeric(dtype) for dtype in data.dtypes)
+        )
+        
+        # Large frames written without their index go through polars, if
+        # all their columns are integers or strings (polars formats bools,
+        # floats and dates differently from to_csv)
+        polars = None
+        if (
+            len(data) > POLARS_CSV_MIN_ROWS
+            and kwargs == {'index': False}
+            and all(self._polars_formats_like_pandas(column) for _, column in data.items())
+        ):
+            try:
+                import polars
+            except ImportError:
+                pass
         
         try:
-            data.to_csv(output_path, **kwargs)
-            print(f"Data exported to {output_path}")
+            if polars is not None:
+                with self._atomic_open(output_path) as f:
+                    polars.from_pandas(data).write_csv(f)
+            elif numeric:
+                with self._atomic_open(output_path, 'w', newline='') as f:
+                    self._write_numeric_csv(data, f, index=kwargs.get('index', True))
+            else:
+                with self._atomic_open(output_path) as f:
+                    data.to_csv(f, **kwargs)
+            log.info(f"Data exported to {output_path}")
             return output_path
         except Exception as e:
-            print(f"Error exporting CSV: {e}")
+            log.error(f"Error exporting CSV: {e}")
             return ""
     
-    def export_json(self, data: Dict, filename: str, **kwargs) -> str:
+    @staticmethod
+    def _polars_formats_like_pandas(column: pd.Series) -> bool:
+        """
+        Check whether polars' write_csv formats a column the same as to_csv.
+        
+        Args:
+            column: DataFrame column
+            
+        Returns:
+            True for integer columns and string columns (missing values
+            allowed), False otherwise
+        """
+        if pd.api.types.is_integer_dtype(column.dtype):
+            return True
+        return (
+            pd.api.types.is_string_dtype(column.dtype)
+            and pd.api.types.infer_dtype(column, skipna=True) in ('string', 'empty')
+        )
+    
+    def _write_numeric_csv(self, data: pd.DataFrame, f, index: bool = True) -> None:
+        """
+        Write an all-numeric DataFrame (with a numeric index, if it's written)
+        to CSV, matching to_csv's output.
+        
+        Each column is converted to strings once with NumPy, and rows are joined
+        and written in chunks of CSV_CHUNK_ROWS.
+        
+        Args:
+            data: DataFrame with only numeric columns
+            f: Text file to write to (opened with newline='')
+            index: Whether to write the index (which must be numeric) as the
+                first column
+        """
+        header = [str(column) for column in data.columns]
+        columns = []
+        for column in range(data.shape[1]):
+            values = data.iloc[:, column].to_numpy()
+            text = values.astype(str)
+            # Missing values are written as empty fields, like to_csv
+            if values.dtype.kind == 'f':
+                text[np.isnan(values)] = ''
+            columns.append(text)
+        
+        if index:
+            header.insert(0, '' if data.index.name is None else str(data.index.name))
+            columns.insert(0, data.index.to_numpy().astype(str))
+        
+        csv.writer(f, lineterminator=os.linesep).writerow(header)
+        for start in range(0, len(data), CSV_CHUNK_ROWS):
+            rows = zip(*(column[start:start + CSV_CHUNK_ROWS] for column in columns))
+            f.write(os.linesep.join(map(','.join, rows)) + os.linesep)
+    
+    def export_json(self, data: Dict, filename: str, compression: Optional[str] = None,
+                    binary_arrays: bool = False, **kwargs) -> str:
         """
         Export dictionary to JSON.
         
+        Uses orjson (which serializes NumPy types natively) when it's installed
+        and only indent/sort_keys are given; otherwise json.dump with NumpyEncoder.
+        
         Args:
             data: Dictionary to export
             filename: Name of the output file
-            **kwargs: Additional arguments to pass to json.dump
+            compression: 'zstd' to write a zstd-compressed '.json.zst' file
+            binary_arrays: Write large NumPy arrays as base64 (see NumpyEncoder)
+            **kwargs: Additional arguments to pass to json.dump (orjson always
+                indents by 2 when indent is given)
             
         Returns:
             Path to the exported file
         """
-        # Make sure filename has .json extension
-        if not filename.endswith('.json'):
-            filename = f"{filename}.json"
-        
-        # Create full path
-        output_path = os.path.join(self.output_dir, filename)
+        output_path = self._resolve(filename, '.json')
+        if compression not in (None, 'zstd'):
+            log.error(f"Error exporting JSON: unsupported compression '{compression}'")
+            return ""
         
         try:
-            with open(output_path, 'w') as f:
-                json.dump(data, f, cls=NumpyEncoder, **kwargs)
-            print(f"Data exported to {output_path}")
+            compressor = None
+            if compression == 'zstd':
+                import zstandard
+                compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+                output_path = f"{output_path}.zst"
+            
+            orjson = None
+            if set(kwargs) <= {'indent', 'sort_keys'}:
+                try:
+                    import orjson
+                except ImportError:
+                    pass
+            
+            encoder = NumpyEncoder(binary_arrays=binary_arrays)
+            if orjson is not None:
+                # orjson only hands arrays to the encoder if it isn't
+                # serializing NumPy types itself
+                option = orjson.OPT_NON_STR_KEYS
+                if not binary_arrays:
+                    option |= orjson.OPT_SERIALIZE_NUMPY
+                if kwargs.get('indent'):
+                    option |= orjson.OPT_INDENT_2
+                if kwargs.get('sort_keys'):
+                    option |= orjson.OPT_SORT_KEYS
+                payload = orjson.dumps(data, default=encoder.default, option=option)
+                if compressor is not None:
+                    payload = compressor.compress(payload)
+                with self._atomic_open(output_path) as f:
+                    f.write(payload)
+            elif compressor is not None:
+                with self._atomic_open(output_path) as f:
+                    with io.TextIOWrapper(compressor.stream_writer(f, closefd=False), encoding='utf-8') as text:
+                        json.dump(data, text, cls=NumpyEncoder, binary_arrays=binary_arrays, **kwargs)
+            else:
+                with self._atomic_open(output_path, 'w') as f:
+                    json.dump(data, f, cls=NumpyEncoder, binary_arrays=binary_arrays, **kwargs)
+            log.info(f"Data exported to {output_path}")
             return output_path
         except Exception as e:
-            print(f"Error exporting JSON: {e}")
+            log.error(f"Error exporting JSON: {e}")
             return ""
     
-    def export_simulation_params(self, params: Dict, filename: str = "simulation_params.json") -> str:
+    def export_simulation_params(self, params: Dict, filename: str = "simulation_params.json", human: bool = True) -> str:
         """
         Export simulation parameters in a format readable by the simulation engine.
         
         Args:
             params: Dictionary of simulation parameters
             filename: Name of the output file
+            human: Also add a readable local 'exported_at' timestamp
             
         Returns:
             Path to the exported file
         """
-        # Add timestamp
-        import datetime
-        params['exported_at'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Add timestamp (nanoseconds since the epoch)
+        exported_at_ns = time.time_ns()
+        params['exported_at_ns'] = exported_at_ns
+        if human:
+            params['exported_at'] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(exported_at_ns // 1_000_000_000))
         
         # Export as JSON
         return self.export_json(params, filename, indent=4)
@@ -107,6 +413,10 @@ class DataExporter:
         """
         Export a trained model using pickle.
         
+        Large contiguous arrays in the model are written out-of-band (pickle
+        protocol 5) to a '<filename>.buffers' file next to the pickle instead of
+        being copied into it; DataImporter.import_model reads both back.
+        
         Args:
             model: Model object to export
             filename: Name of the output file
@@ -114,18 +424,27 @@ class DataExporter:
         Returns:
             Path to the exported file
         """
-        # Make sure filename has .pkl extension
-        if not filename.endswith('.pkl'):
-            filename = f"{filename}.pkl"
+        output_path = self._resolve(filename, '.pkl')
         
-        # Create full path
-        output_path = os.path.join(self.output_dir, filename)
+        buffers_path = f"{output_path}.buffers"
         
         try:
-            with open(output_path, 'wb') as f:
-                pickle.dump(model, f)
-            print(f"Model exported to {output_path}")
+            buffers = []
+            with self._atomic_open(output_path) as f:
+                pickle.dump(model, f, protocol=5, buffer_callback=buffers.append)
+                
+                # Write the out-of-band buffers, each prefixed with its length
+                # (before the pickle itself is put in place)
+                if buffers:
+                    with self._atomic_open(buffers_path) as buffers_file:
+                        for buffer in buffers:
+                            data = buffer.raw()
+                            buffers_file.write(BUFFER_LENGTH.pack(data.nbytes))
+                            buffers_file.write(data)
+                elif os.path.exists(buffers_path):
+                    os.remove(buffers_path)
+            log.info(f"Model exported to {output_path}")
             return output_path
         except Exception as e:
-            print(f"Error exporting model: {e}")
+            log.error(f"Error exporting model: {e}")
             return ""
\ No newline at end of file
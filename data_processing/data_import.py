@@ -1,9 +1,20 @@
 # data_processing/data_import.py
 import pandas as pd
+import numpy as np
+import base64
 import os
+import shutil
 import requests
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Iterator, Optional, Union
 import json
+import logging
+import pickle
+import struct
+
+log = logging.getLogger(__name__)
+
+# Byte-length prefix for each out-of-band buffer in a model's .buffers file
+BUFFER_LENGTH = struct.Struct('<Q')
 
 class DataImporter:
     """
@@ -18,30 +29,159 @@ class DataImporter:
         self.data_dir = data_dir
         
         # Create data directory if it doesn't exist
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        os.makedirs(data_dir, exist_ok=True)
     
-    def import_csv(self, file_path: str, **kwargs) -> pd.DataFrame:
+    def import_csv(self, file_path: str, engine: str = "pandas", **kwargs) -> pd.DataFrame:
         """
         Import data from a CSV file.
         
+        By default the file is parsed with pandas.read_csv. With engine='auto'
+        or 'pyarrow' it's parsed with pyarrow's multithreaded reader instead,
+        when pyarrow is installed and no pandas options are given. pyarrow
+        infers column types differently (e.g. date-like columns become
+        datetimes), so the dtypes may differ from read_csv's.
+        
         Args:
             file_path: Path to the CSV file
-            **kwargs: Additional arguments to pass to pandas.read_csv
+            engine: 'pandas', 'auto', 'pyarrow' or 'polars'
+            **kwargs: Additional arguments to pass to pandas.read_csv (or
+                polars.read_csv with engine='polars')
             
         Returns:
             DataFrame containing the data
         """
+        if engine in ("auto", "pyarrow") and not kwargs:
+            try:
+                import pyarrow.csv as pacsv
+                read_options = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+                return pacsv.read_csv(file_path, read_options=read_options).to_pandas()
+            except ImportError:
+                pass
+            except Exception as e:
+                log.warning(f"pyarrow couldn't read {file_path} ({e}), using pandas")
+        elif engine == "polars":
+            try:
+                import polars as pl
+                return pl.read_csv(file_path, **kwargs).to_pandas()
+            except Exception as e:
+                log.error(f"Error importing CSV with polars: {e}")
+                return pd.DataFrame()
+        
         try:
             return pd.read_csv(file_path, **kwargs)
         except Exception as e:
-            print(f"Error importing CSV: {e}")
+            log.error(f"Error importing CSV: {e}")
             return pd.DataFrame()
     
+    def import_csv_chunks(self, file_path: str, chunksize: int = 100_000, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Import data from a CSV file in chunks, without loading it all at once.
+        
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Number of rows per chunk
+            **kwargs: Additional arguments to pass to pandas.read_csv
+            
+        Returns:
+            Iterator of DataFrames with up to chunksize rows each
+        """
+        return pd.read_csv(file_path, chunksize=chunksize, iterator=True, **kwargs)
+    
+    def download_and_stream(self, url: str, chunksize: int = 100_000, **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Download CSV data from a URL and parse it in chunks as it arrives
+        (nothing is cached to disk).
+        
+        Args:
+            url: URL to download data from
+            chunksize: Number of rows per chunk
+            **kwargs: Additional arguments to pass to pandas.read_csv
+            
+        Yields:
+            DataFrames with up to chunksize rows each
+        """
+        log.info(f"Streaming data from {url}")
+        with requests.get(url, stream=True, timeout=(5, None)) as response:
+            response.raise_for_status()  # Raise exception for HTTP errors
+            response.raw.decode_content = True
+            with pd.read_csv(response.raw, chunksize=chunksize, **kwargs) as reader:
+                yield from reader
+    
+    @staticmethod
+    def decode_ndarray(obj: Dict):
+        """
+        json object_hook that turns arrays written by DataExporter.export_json
+        with binary_arrays=True back into NumPy arrays.
+        
+        Args:
+            obj: Decoded JSON object
+            
+        Returns:
+            The array, or obj unchanged if it isn't an encoded array
+        """
+        if "__ndarray__" not in obj:
+            return obj
+        data = bytearray(base64.b64decode(obj["__ndarray__"]))
+        return np.frombuffer(data, dtype=np.dtype(obj["dtype"])).reshape(obj["shape"])
+    
+    def import_json(self, file_path: str) -> Dict:
+        """
+        Import data from a JSON file (large arrays exported as base64 are
+        decoded to NumPy arrays).
+        
+        Args:
+            file_path: Path to the JSON file
+            
+        Returns:
+            Dictionary containing the data (empty if it couldn't be loaded)
+        """
+        try:
+            with open(file_path) as f:
+                return json.load(f, object_hook=self.decode_ndarray)
+        except Exception as e:
+            log.error(f"Error importing JSON: {e}")
+            return {}
+    
+    def import_model(self, file_path: str):
+        """
+        Import a model exported with DataExporter.export_model.
+        
+        Args:
+            file_path: Path to the .pkl file (its '.buffers' file is read too
+                if present)
+            
+        Returns:
+            The model object, or None if it couldn't be loaded
+        """
+        buffers_path = f"{file_path}.buffers"
+        
+        try:
+            # Read the out-of-band buffers, each prefixed with its length
+            buffers = []
+            if os.path.exists(buffers_path):
+                with open(buffers_path, 'rb') as f:
+                    data = bytearray(f.read())
+                view = memoryview(data)
+                offset = 0
+                while offset < len(data):
+                    (length,) = BUFFER_LENGTH.unpack_from(data, offset)
+                    offset += BUFFER_LENGTH.size
+                    buffers.append(view[offset:offset + length])
+                    offset += length
+            
+            with open(file_path, 'rb') as f:
+                return pickle.load(f, buffers=buffers)
+        except Exception as e:
+            log.error(f"Error importing model: {e}")
+            return None
+    
     def download_and_cache_data(self, url: str, cache_file: str, force_refresh: bool = False) -> pd.DataFrame:
         """
         Download data from a URL and cache it locally.
         
+        The downloaded CSV is also saved as Parquet ('<cache_file>.parquet'),
+        which later calls read instead of re-parsing the CSV.
+        
         Args:
             url: URL to download data from
             cache_file: Local file path to cache the data
@@ -52,26 +192,61 @@ class DataImporter:
         """
         # Check if cache exists and we're not forcing a refresh
         cache_path = os.path.join(self.data_dir, cache_file)
-        if os.path.exists(cache_path) and not force_refresh:
-            print(f"Loading cached data from {cache_path}")
-            return self.import_csv(cache_path)
+        parquet_path = f"{cache_path}.parquet"
+        if not force_refresh:
+            # Use the Parquet copy unless the CSV has been replaced since
+            if os.path.exists(parquet_path) and (
+                not os.path.exists(cache_path)
+                or os.path.getmtime(parquet_path) >= os.path.getmtime(cache_path)
+            ):
+                try:
+                    log.info(f"Loading cached data from {parquet_path}")
+                    return pd.read_parquet(parquet_path)
+                except Exception as e:
+                    log.error(f"Error reading Parquet cache: {e}")
+            
+            if os.path.exists(cache_path):
+                log.info(f"Loading cached data from {cache_path}")
+                df = self.import_csv(cache_path)
+                self._write_parquet_cache(df, parquet_path)
+                return df
         
         # Download data
         try:
-            print(f"Downloading data from {url}")
-            response = requests.get(url)
-            response.raise_for_status()  # Raise exception for HTTP errors
-            
-            # Save to cache
-            with open(cache_path, 'wb') as f:
-                f.write(response.content)
+            log.info(f"Downloading data from {url}")
+            with requests.get(url, stream=True, timeout=(5, None)) as response:
+                response.raise_for_status()  # Raise exception for HTTP errors
+                
+                # Stream to the cache file in 1 MB chunks rather than holding
+                # the whole response in memory
+                response.raw.decode_content = True
+                with open(cache_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
                 
             # Return as DataFrame
-            return pd.read_csv(cache_path)
+            df = self.import_csv(cache_path)
+            self._write_parquet_cache(df, parquet_path)
+            return df
         except Exception as e:
-            print(f"Error downloading data: {e}")
+            log.error(f"Error downloading data: {e}")
             return pd.DataFrame()
     
+    def _write_parquet_cache(self, df: pd.DataFrame, parquet_path: str) -> None:
+        """
+        Save a Parquet copy of cached CSV data (skipped if it can't be written).
+        
+        Args:
+            df: DataFrame read from the cached CSV
+            parquet_path: Path of the Parquet file
+        """
+        if df.empty:
+            return
+        
+        try:
+            df.to_parquet(parquet_path, compression="zstd")
+        except Exception as e:
+            log.warning(f"Couldn't write Parquet cache: {e}")
+    
     # Future methods for API integrations
     def import_nflfastr_data(self, seasons: List[int], force_refresh: bool = False):
         """
@@ -2,9 +2,79 @@
 import os
 import json
 import random
+import logging
+import logging.handlers
 from simulation.engine import SimulationEngine
 from models.game import GameConditions
 
+# Log records held in memory before they're written to stderr
+LOG_BUFFER_CAPACITY = 20
+
+def configure_logging(verbose=True):
+    """
+    Send log messages (e.g. from the data exporter) to stderr, batched
+    through a memory buffer.
+    
+    INFO messages are delayed until LOG_BUFFER_CAPACITY records have piled
+    up, a warning or error is logged, flush_logs is called (run_demo and
+    run_custom_simulation do this when they finish) or the program exits.
+    
+    Args:
+        verbose (bool): Show INFO messages, otherwise only warnings and errors
+    """
+    handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=logging.StreamHandler()
+    )
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format="%(message)s",
+        handlers=[handler]
+    )
+
+def flush_logs():
+    """Write out log messages still held in the logging buffer."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+def export_fantasy_projections(sim_engine, file_path="results/fantasy_projections.parquet"):
+    """
+    Generate fantasy projections and export them through the DataExporter.
+    
+    The file extension picks the format (.parquet, .feather or .csv, Parquet if
+    there is none). Without pyarrow, which Parquet and Feather need, they're
+    exported as CSV instead; without pandas they're saved as CSV by the engine.
+    
+    Args:
+        sim_engine (SimulationEngine): Engine with teams loaded
+        file_path (str): Output file path
+        
+    Returns:
+        str: Path to the exported file
+    """
+    projections = sim_engine.generate_fantasy_projections()
+    
+    output_dir, filename = os.path.split(file_path)
+    name, ext = os.path.splitext(filename)
+    
+    try:
+        import pandas as pd
+        from data_processing.data_export import DataExporter
+    except ImportError:
+        return sim_engine.save_fantasy_projections(projections, f"{name}.csv")
+    
+    file_format = ext.lstrip('.') or "parquet"
+    if file_format in ("parquet", "feather"):
+        try:
+            import pyarrow
+        except ImportError:
+            file_format = "csv"
+    
+    exporter = DataExporter(output_dir=output_dir or sim_engine.output_dir)
+    data = pd.DataFrame(projections['players'])
+    if file_format == "csv":
+        return exporter.export_csv(data, name, index=False)
+    return exporter.export_dataframe(data, name, format=file_format)
+
 def run_demo():
     """Run a demonstration of the simulation framework."""
     print("Football Game Simulation")
@@ -36,7 +106,7 @@ def run_demo():
     
     # Run multiple simulations
     print("\nRunning multiple simulations...")
-    projections = sim_engine.run_multiple_simulations(team_ids[0], team_ids[1], num_sims=10)
+    projections = sim_engine.run_multiple_simulations(team_ids[0], team_ids[1], num_sims=10, n_jobs=-1)
     
     print("\nSimulation Results:")
     print(f"Home win probability: {projections['home_win_pct']:.1%}")
@@ -58,9 +128,10 @@ def run_demo():
     
     # Export fantasy projections
     print("\nExporting fantasy projections...")
-    all_projections = sim_engine.export_fantasy_projections("results/fantasy_projections.csv")
+    projections_file = export_fantasy_projections(sim_engine)
     
     print("\nDone! Check the 'results' directory for detailed output files.")
+    flush_logs()
 
 def run_custom_simulation():
     """
@@ -94,9 +165,8 @@ def run_custom_simulation():
     
     # List available teams
     print("\nAvailable Teams:")
-    team_ids = list(sim_engine.teams.keys())
-    for i, team_id in enumerate(team_ids):
-        team = sim_engine.teams[team_id]
+    teams_by_index = list(sim_engine.teams.items())
+    for i, (team_id, team) in enumerate(teams_by_index):
         print(f"{i+1}. {team.name} ({team_id})")
     
     # Set up simulation parameters
@@ -108,12 +178,14 @@ def run_custom_simulation():
     
     if sim_choice == "1":
         # Single game
-        home_idx = int(input(f"Select home team (1-{len(team_ids)}): ")) - 1
-        away_idx = int(input(f"Select away team (1-{len(team_ids)}): ")) - 1
+        home_idx = int(input(f"Select home team (1-{len(teams_by_index)}): ")) - 1
+        away_idx = int(input(f"Select away team (1-{len(teams_by_index)}): ")) - 1
         
-        if 0 <= home_idx < len(team_ids) and 0 <= away_idx < len(team_ids):
+        if 0 <= home_idx < len(teams_by_index) and 0 <= away_idx < len(teams_by_index):
             verbose = input("Show detailed play-by-play? (y/n): ").lower() == 'y'
-            result = sim_engine.simulate_game(team_ids[home_idx], team_ids[away_idx], verbose=verbose)
+            home_id, _ = teams_by_index[home_idx]
+            away_id, _ = teams_by_index[away_idx]
+            result = sim_engine.simulate_game(home_id, away_id, verbose=verbose)
             
             print("\nGame Result:")
             print(f"{result['home_team']} {result['home_score']} - {result['away_team']} {result['away_score']}")
@@ -122,15 +194,15 @@ def run_custom_simulation():
     
     elif sim_choice == "2":
         # Multiple simulations
-        home_idx = int(input(f"Select home team (1-{len(team_ids)}): ")) - 1
-        away_idx = int(input(f"Select away team (1-{len(team_ids)}): ")) - 1
+        home_idx = int(input(f"Select home team (1-{len(teams_by_index)}): ")) - 1
+        away_idx = int(input(f"Select away team (1-{len(teams_by_index)}): ")) - 1
         
-        if 0 <= home_idx < len(team_ids) and 0 <= away_idx < len(team_ids):
+        if 0 <= home_idx < len(teams_by_index) and 0 <= away_idx < len(teams_by_index):
             num_sims = int(input("Number of simulations to run: "))
             
-            projections = sim_engine.run_multiple_simulations(
-                team_ids[home_idx], team_ids[away_idx], num_sims=num_sims
-            )
+            home_id, _ = teams_by_index[home_idx]
+            away_id, _ = teams_by_index[away_idx]
+            projections = sim_engine.run_multiple_simulations(home_id, away_id, num_sims=num_sims)
             
             print("\nSimulation Results:")
             print(f"Home win probability: {projections['home_win_pct']:.1%}")
@@ -162,12 +234,16 @@ def run_custom_simulation():
     if export:
         file_path = input("Enter output file path (or press Enter for default): ")
         if not file_path:
-            file_path = "results/fantasy_projections.csv"
+            file_path = "results/fantasy_projections.parquet"
         
-        sim_engine.export_fantasy_projections(file_path)
+        file_path = export_fantasy_projections(sim_engine, file_path)
         print(f"Projections exported to {file_path}")
+    
+    flush_logs()
 
 if __name__ == "__main__":
+    configure_logging()
+    
     # Choose mode
     print("Select mode:")
     print("1. Run demonstration")
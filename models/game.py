@@ -1,11 +1,15 @@
 # models/game.py
+import os
 import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from math import cos, log, sin, sqrt, tau
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 from .team import Team
-from .player import Player
+from .player import STAT_FIELDS, Player, PlayerStats, StatIdx
 
-@dataclass
+@dataclass(slots=True)
 class GameConditions:
     """Environment conditions that affect game simulation."""
     weather: str = "clear"  # clear, rain, snow, wind
@@ -55,45 +59,56 @@ class GameConditions:
             
         return factors
 
-@dataclass
+@dataclass(slots=True)
 class GameClock:
-    """Tracks game time and provides time management methods."""
-    quarter: int = 1
-    minutes: int = 15
-    seconds: int = 0
+    """
+    Tracks game time and provides time management methods.
+    
+    Time is kept as the seconds elapsed since kickoff; the quarter and the
+    minutes and seconds left in it are worked out when they're read.
+    """
+    elapsed: int = 0  # Seconds since kickoff
     is_running: bool = False
     
     # Game configuration
     quarter_length: int = 15  # Minutes per quarter
+    total_length: int = field(init=False)  # Seconds in regulation
+    
+    def __post_init__(self):
+        self.total_length = 4 * self.quarter_length * 60
+    
+    @property
+    def quarter(self) -> int:
+        """Current quarter (5 once the game is over)."""
+        return min(self.elapsed, self.total_length) // (self.quarter_length * 60) + 1
+    
+    @property
+    def minutes(self) -> int:
+        """Whole minutes left in the quarter."""
+        return self.quarter_seconds_left() // 60
+    
+    @property
+    def seconds(self) -> int:
+        """Seconds left in the quarter beyond the whole minutes."""
+        return self.quarter_seconds_left() % 60
+    
+    def quarter_seconds_left(self) -> int:
+        """Seconds left in the current quarter (0 once the game is over)."""
+        if self.elapsed >= self.total_length:
+            return 0
+        quarter_seconds = self.quarter_length * 60
+        return quarter_seconds - self.elapsed % quarter_seconds
     
     def advance(self, seconds_elapsed: int):
-        """Advance the game clock by specified seconds."""
+        """Advance the game clock by specified seconds (running over into the next quarter)."""
         if not self.is_running:
             return
-            
-        total_seconds = self.minutes * 60 + self.seconds - seconds_elapsed
         
-        if total_seconds <= 0:
-            # End of quarter
-            self.quarter += 1
-            remaining_seconds = abs(total_seconds)
-            
-            if self.quarter <= 4:
-                self.minutes = self.quarter_length
-                self.seconds = 0
-                
-                # Apply remaining seconds from play that went over
-                if remaining_seconds > 0:
-                    self.advance(remaining_seconds)
-            else:
-                # Game over
-                self.minutes = 0
-                self.seconds = 0
-                self.is_running = False
-        else:
-            # Update minutes and seconds
-            self.minutes = total_seconds // 60
-            self.seconds = total_seconds % 60
+        self.elapsed += seconds_elapsed
+        if self.elapsed >= self.total_length:
+            # Game over
+            self.elapsed = self.total_length
+            self.is_running = False
     
     def start(self):
         """Start the clock."""
@@ -104,54 +119,191 @@ class GameClock:
         self.is_running = False
     
     def reset_for_quarter(self):
-        """Reset clock for a new quarter."""
-        self.minutes = self.quarter_length
-        self.seconds = 0
+        """Reset clock to the start of the current quarter."""
+        quarter_seconds = self.quarter_length * 60
+        self.elapsed -= self.elapsed % quarter_seconds
     
     def is_game_over(self) -> bool:
         """Check if the game is over."""
-        return self.quarter > 4
+        return self.elapsed >= self.total_length
     
     def time_remaining(self) -> int:
         """Return total seconds remaining in the game."""
-        quarters_left = 4 - self.quarter + 1
-        return (quarters_left - 1) * self.quarter_length * 60 + self.minutes * 60 + self.seconds
+        return self.total_length - self.elapsed
     
     def __str__(self) -> str:
         """String representation of the game clock."""
         return f"Q{self.quarter} {self.minutes}:{self.seconds:02d}"
 
-@dataclass
+@dataclass(slots=True)
+class PlayResult:
+    """Outcome of a single simulated play."""
+    play_type: str  # pass, run
+    down: int
+    distance: int
+    field_position: int
+    quarter: int
+    time_seconds: int  # Seconds left in the quarter
+    yards_gained: int = 0
+    result: str = ""  # complete, incomplete, interception, run, fumble
+    is_touchdown: bool = False
+    is_interception: bool = False
+    is_fumble: bool = False
+    
+    # IDs of the players involved
+    passer: Optional[str] = None
+    receiver: Optional[str] = None
+    runner: Optional[str] = None
+    primary_defender: Optional[str] = None
+    
+    @property
+    def time(self) -> str:
+        """Time left in the quarter as 'M:SS'."""
+        minutes, seconds = divmod(self.time_seconds, 60)
+        return f"{minutes}:{seconds:02d}"
+    
+    def as_dict(self) -> Dict:
+        """Return the play as a dict (flags only when set, player IDs only when known)."""
+        play = {
+            "play_type": self.play_type,
+            "down": self.down,
+            "distance": self.distance,
+            "field_position": self.field_position,
+            "quarter": self.quarter,
+            "time": self.time,
+            "yards_gained": self.yards_gained,
+            "result": self.result
+        }
+        for flag in ("is_touchdown", "is_interception", "is_fumble"):
+            if getattr(self, flag):
+                play[flag] = True
+        for role in ("passer", "receiver", "runner", "primary_defender"):
+            if getattr(self, role) is not None:
+                play[role] = getattr(self, role)
+        return play
+
+class PlayHistory:
+    """
+    Plays of a game stored column by column: one compact array per
+    PlayResult field instead of an object per play. Plays are added with
+    append and read back as PlayResults by index or iteration.
+    """
+    PLAY_TYPES = ("pass", "run")
+    RESULTS = ("", "complete", "incomplete", "interception", "run", "fumble")
+    
+    # Codes stored in the play_type and result columns
+    _PLAY_TYPE_CODES = {play_type: code for code, play_type in enumerate(PLAY_TYPES)}
+    _RESULT_CODES = {result: code for code, result in enumerate(RESULTS)}
+    
+    def __init__(self):
+        self.play_type = array("b")
+        self.down = array("b")
+        self.distance = array("h")
+        self.field_position = array("h")
+        self.quarter = array("b")
+        self.time_seconds = array("h")
+        self.yards_gained = array("h")
+        self.result = array("b")
+        self.is_touchdown = array("b")
+        self.is_interception = array("b")
+        self.is_fumble = array("b")
+        
+        # IDs of the players involved (None if nobody)
+        self.passer: List[Optional[str]] = []
+        self.receiver: List[Optional[str]] = []
+        self.runner: List[Optional[str]] = []
+        self.primary_defender: List[Optional[str]] = []
+    
+    def append(self, play: PlayResult):
+        """Add a play to the end of the history."""
+        self.play_type.append(self._PLAY_TYPE_CODES[play.play_type])
+        self.down.append(play.down)
+        self.distance.append(play.distance)
+        self.field_position.append(play.field_position)
+        self.quarter.append(play.quarter)
+        self.time_seconds.append(play.time_seconds)
+        self.yards_gained.append(play.yards_gained)
+        self.result.append(self._RESULT_CODES[play.result])
+        self.is_touchdown.append(play.is_touchdown)
+        self.is_interception.append(play.is_interception)
+        self.is_fumble.append(play.is_fumble)
+        self.passer.append(play.passer)
+        self.receiver.append(play.receiver)
+        self.runner.append(play.runner)
+        self.primary_defender.append(play.primary_defender)
+    
+    def __len__(self) -> int:
+        return len(self.play_type)
+    
+    def __getitem__(self, index: int) -> PlayResult:
+        """Rebuild the PlayResult of a single play."""
+        return PlayResult(
+            self.PLAY_TYPES[self.play_type[index]],
+            self.down[index],
+            self.distance[index],
+            self.field_position[index],
+            self.quarter[index],
+            self.time_seconds[index],
+            self.yards_gained[index],
+            self.RESULTS[self.result[index]],
+            bool(self.is_touchdown[index]),
+            bool(self.is_interception[index]),
+            bool(self.is_fumble[index]),
+            self.passer[index],
+            self.receiver[index],
+            self.runner[index],
+            self.primary_defender[index]
+        )
+    
+    def __iter__(self) -> Iterator[PlayResult]:
+        for index in range(len(self)):
+            yield self[index]
+    
+    def to_dicts(self) -> List[Dict]:
+        """Return the plays as a list of dicts (see PlayResult.as_dict)."""
+        return [play.as_dict() for play in self]
+
+@dataclass(slots=True)
 class GameState:
     """Current state of the game used in simulation."""
     home_score: int = 0
     away_score: int = 0
     
-    possession: Optional[str] = None  # ID of team with possession
+    # Team IDs (home, away) and which of them has possession (0 = home, 1 = away)
+    team_ids: Tuple[str, str] = ("home", "away")
+    possession_index: int = 0
     down: int = 1
     distance: int = 10
     field_position: int = 20  # Yards from own goal line
     
     # Game situation tracking
-    is_redzone: bool = False
     is_two_minute_warning: bool = False
     last_score_team: Optional[str] = None
     home_timeouts: int = 3
     away_timeouts: int = 3
     
     # Play history for analysis
-    play_history: List[Dict] = field(default_factory=list)
+    play_history: PlayHistory = field(default_factory=PlayHistory)
+    
+    @property
+    def possession(self) -> str:
+        """ID of team with possession."""
+        return self.team_ids[self.possession_index]
+    
+    @possession.setter
+    def possession(self, team_id: str):
+        self.possession_index = self.team_ids.index(team_id)
+    
+    @property
+    def is_redzone(self) -> bool:
+        """Whether the offense is inside the opponent's 20."""
+        return self.field_position >= 80
     
     def update_field_position(self, yards_gained: int):
         """Update field position based on yards gained/lost."""
-        self.field_position += yards_gained
-        
-        # Check for change of possession if past 100
-        if self.field_position > 100:
-            self.field_position = 100  # At opponent's goal line
-        
-        # Update redzone status
-        self.is_redzone = (self.field_position >= 80)
+        # Stop at the opponent's goal line
+        field_position = self.field_position + yards_gained
+        self.field_position = field_position if field_position < 100 else 100
     
     def update_down_and_distance(self, yards_gained: int):
         """Update down and distance based on play result."""
@@ -174,44 +326,302 @@ class GameState:
     
     def change_possession(self):
         """Change possession between teams."""
-        # Flip field position to other side of field
-        self.field_position = 100 - self.field_position
+        # Flip field position to other side of field (minimum 20 yards if backed up)
+        self.field_position = max(20, 100 - self.field_position)
         
         # Reset downs
         self.down = 1
         self.distance = 10
         
-        # Minimum 20 yards if backed up
-        if self.field_position < 20:
-            self.field_position = 20
-        
         # Switch possession team
-        self.possession = 'away' if self.possession == 'home' else 'home'
+        self.possession_index ^= 1
     
-    def add_play_to_history(self, play_data: Dict):
+    def add_play_to_history(self, play_data: PlayResult):
         """Add a play to the history for later analysis."""
         self.play_history.append(play_data)
     
     def get_score_difference(self) -> int:
         """Get current score differential from possession team perspective."""
-        if self.possession == 'home':
-            return self.home_score - self.away_score
-        else:
-            return self.away_score - self.home_score
+        return (self.home_score - self.away_score) * (1 - 2 * self.possession_index)
     
     def get_timeouts_left(self) -> int:
         """Get timeouts left for possession team."""
-        return self.home_timeouts if self.possession == 'home' else self.away_timeouts
+        return (self.home_timeouts, self.away_timeouts)[self.possession_index]
     
     def is_late_game(self, clock: GameClock) -> bool:
         """Check if it's late in the game (4th quarter or OT)."""
         return clock.quarter >= 4 and clock.minutes < 8
 
+class NormalPool:
+    """
+    Normally distributed random numbers, generated in bulk from the random
+    module (Box-Muller, a pair per two uniforms) and handed out one at a time.
+    """
+    
+    def __init__(self, size: int = 128):
+        """
+        Initialize an empty pool that refills size values at a time (the
+        default is about what one game uses).
+        """
+        self.size = size
+        self._values = []
+    
+    def _refill(self):
+        """Generate the next batch of standard normal values."""
+        uniform = random.random
+        values = self._values
+        for _ in range(self.size // 2):
+            radius = sqrt(-2.0 * log(1.0 - uniform()))
+            angle = tau * uniform()
+            values.append(radius * cos(angle))
+            values.append(radius * sin(angle))
+    
+    def normalvariate(self, mu: float, sigma: float) -> float:
+        """Return a normal random number with mean mu and standard deviation sigma."""
+        if not self._values:
+            self._refill()
+        return mu + sigma * self._values.pop()
+
+def draw_play_outcome(is_pass: bool, success_prob: float, passing_modifier: float, yards_scale: float,
+                      yards_to_endzone: int, int_chance: Optional[float], fumble_chance: Optional[float],
+                      normalvariate: Callable[[float, float], float] = random.normalvariate) -> Tuple[str, int, bool, bool]:
+    """
+    Draw the random outcome of a play, without touching players or game state.
+    
+    Args:
+        is_pass: Whether the play is a pass (otherwise a run)
+        success_prob: Base success probability for the offense
+        passing_modifier: Weather modifier for passing
+        yards_scale: Yards multiplier for the offense (see offense_play_factors)
+        yards_to_endzone: Yards from the ball to the opponent's goal line
+        int_chance: Chance an incomplete pass is intercepted (None if there's no QB)
+        fumble_chance: Chance of a fumble on a run (None if there's no RB)
+        normalvariate: Source of normal random numbers (e.g. a NormalPool's)
+        
+    Returns:
+        Tuple of (outcome, yards gained, touchdown, defender recovers fumble), where
+        outcome is 'complete', 'incomplete', 'interception', 'run' or 'fumble'
+    """
+    if is_pass:
+        if int_chance is None:
+            return "incomplete", 0, False, False
+        
+        if random.random() < success_prob * passing_modifier:
+            # Determine yards gained
+            base_yards = normalvariate(6, 4)  # Slightly more conservative
+            yards_gained = max(0, int(base_yards * yards_scale))
+            
+            # Check for touchdown
+            is_touchdown = yards_gained >= yards_to_endzone
+            
+            # Make long touchdowns more rare
+            if is_touchdown and yards_to_endzone > 25:
+                # Less likely to score from far away
+                if random.random() > 0.08:  # Only 8% chance of long TD
+                    yards_gained = min(yards_gained, 25)  # Cap the gain
+                    is_touchdown = False
+            
+            return "complete", yards_gained, is_touchdown, False
+        
+        # Incomplete pass - check for interception
+        if random.random() < int_chance:
+            return "interception", 0, False, False
+        return "incomplete", 0, False, False
+    
+    if fumble_chance is None:
+        return "run", 0, False, False
+    
+    # Determine yards gained
+    base_yards = normalvariate(3.5, 2.5)  # More realistic average
+    yards_gained = max(-2, int(base_yards * yards_scale))
+    
+    # Check for touchdown
+    is_touchdown = yards_gained >= yards_to_endzone
+    
+    # Make long touchdowns more rare
+    if is_touchdown and yards_to_endzone > 20:
+        # Less likely to score from far away
+        if random.random() > 0.1:  # Only 10% chance of long TD
+            yards_gained = min(yards_gained, 20)  # Cap the gain
+            is_touchdown = False
+    
+    # Check for fumble
+    if random.random() < fumble_chance:
+        # 50% chance the defender recovers the fumble
+        return "fumble", yards_gained, is_touchdown, random.random() > 0.5
+    return "run", yards_gained, is_touchdown, False
+
+def offense_play_factors(off_rating: float, qb: Optional[Player], rb: Optional[Player]) -> Tuple[float, Optional[float], Optional[float]]:
+    """
+    Work out the parts of draw_play_outcome's inputs that only depend on the
+    offense, so they can be computed once rather than every play.
+    
+    Args:
+        off_rating: Offensive rating of the team
+        qb: Starting QB (None if there isn't one)
+        rb: Starting RB (None if there isn't one)
+        
+    Returns:
+        Tuple of (yards scale, interception chance, fumble chance)
+    """
+    yards_scale = 0.7 + off_rating * 0.3
+    int_chance = 0.08 * (1 - qb.attributes.decision_making / 100) if qb else None
+    fumble_chance = 0.03 * (1 - rb.attributes.strength / 200) if rb else None
+    return yards_scale, int_chance, fumble_chance
+
+def apply_play_to_state(state: GameState, clock: GameClock, yards_gained: int,
+                        is_touchdown: bool, is_turnover: bool, is_incomplete: bool):
+    """
+    Update the clock, down and distance, score and possession after a play.
+    
+    Args:
+        state: Game state to update
+        clock: Game clock to update
+        yards_gained: Yards gained on the play
+        is_touchdown: Whether the play scored a touchdown
+        is_turnover: Whether the ball was turned over (interception or fumble)
+        is_incomplete: Whether the play was an incomplete pass
+    """
+    # Clock management (simplified)
+    time_elapsed = 30  # Average play time in seconds
+    if not (is_touchdown or is_turnover or is_incomplete):
+        # Clock runs on successful plays
+        clock.advance(time_elapsed)
+    
+    # Update game state
+    if is_turnover:
+        # Turnover - change possession
+        state.change_possession()
+    else:
+        # Update down, distance, field position
+        state.update_field_position(yards_gained)
+        state.update_down_and_distance(yards_gained)
+        
+        if is_touchdown:
+            # Handle touchdown
+            if state.possession_index == 0:
+                state.home_score += 7  # Simplified, assuming extra point
+            else:
+                state.away_score += 7
+            
+            # Reset after touchdown
+            state.change_possession()
+        elif state.down > 4:
+            # Turnover on downs
+            state.change_possession()
+
+# Indexes (StatIdx) of the player stats that change during play. While a
+# game is simulated they're counted in a stat row per player and added to
+# the players' stats at the end. Plain ints index arrays faster than
+# StatIdx members.
+PASSING_ATTEMPTS = StatIdx.PASSING_ATTEMPTS.value
+PASSING_COMPLETIONS = StatIdx.PASSING_COMPLETIONS.value
+PASSING_YARDS = StatIdx.PASSING_YARDS.value
+PASSING_TDS = StatIdx.PASSING_TDS.value
+PASSING_INTS = StatIdx.PASSING_INTS.value
+RUSHING_ATTEMPTS = StatIdx.RUSHING_ATTEMPTS.value
+RUSHING_YARDS = StatIdx.RUSHING_YARDS.value
+RUSHING_TDS = StatIdx.RUSHING_TDS.value
+RECEIVING_TARGETS = StatIdx.RECEIVING_TARGETS.value
+RECEIVING_CATCHES = StatIdx.RECEIVING_CATCHES.value
+RECEIVING_YARDS = StatIdx.RECEIVING_YARDS.value
+RECEIVING_TDS = StatIdx.RECEIVING_TDS.value
+FUMBLES = StatIdx.FUMBLES.value
+TACKLES = StatIdx.TACKLES.value
+INTERCEPTIONS = StatIdx.INTERCEPTIONS.value
+FORCED_FUMBLES = StatIdx.FORCED_FUMBLES.value
+FUMBLE_RECOVERIES = StatIdx.FUMBLE_RECOVERIES.value
+
+def _qb_stats(stats: PlayerStats) -> Optional[Dict]:
+    """QB box score stats (None if the QB didn't pass or run)."""
+    if stats.passing_attempts == 0 and stats.rushing_attempts == 0:
+        return None
+    return {
+        "passing_attempts": stats.passing_attempts,
+        "passing_completions": stats.passing_completions,
+        "passing_yards": stats.passing_yards,
+        "passing_tds": stats.passing_tds,
+        "passing_ints": stats.passing_ints,
+        "comp_pct": round(stats.passing_completions / stats.passing_attempts * 100, 1) if stats.passing_attempts > 0 else 0,
+        "yards_per_attempt": round(stats.passing_yards / stats.passing_attempts, 1) if stats.passing_attempts > 0 else 0,
+        
+        # QB rushing
+        "rushing_attempts": stats.rushing_attempts,
+        "rushing_yards": stats.rushing_yards,
+        "rushing_tds": stats.rushing_tds,
+    }
+
+def _rb_stats(stats: PlayerStats) -> Optional[Dict]:
+    """RB box score stats (None if the RB didn't run or get targeted)."""
+    if stats.rushing_attempts == 0 and stats.receiving_targets == 0:
+        return None
+    return {
+        "rushing_attempts": stats.rushing_attempts,
+        "rushing_yards": stats.rushing_yards,
+        "rushing_tds": stats.rushing_tds,
+        "yards_per_carry": round(stats.rushing_yards / stats.rushing_attempts, 1) if stats.rushing_attempts > 0 else 0,
+        
+        # RB receiving
+        "receiving_targets": stats.receiving_targets,
+        "receiving_catches": stats.receiving_catches,
+        "receiving_yards": stats.receiving_yards,
+        "receiving_tds": stats.receiving_tds,
+    }
+
+def _receiver_stats(stats: PlayerStats) -> Optional[Dict]:
+    """WR/TE box score stats (None if the receiver wasn't targeted and didn't run)."""
+    if stats.receiving_targets == 0 and stats.rushing_attempts == 0:
+        return None
+    return {
+        "receiving_targets": stats.receiving_targets,
+        "receiving_catches": stats.receiving_catches,
+        "receiving_yards": stats.receiving_yards,
+        "receiving_tds": stats.receiving_tds,
+        "yards_per_catch": round(stats.receiving_yards / stats.receiving_catches, 1) if stats.receiving_catches > 0 else 0,
+        "catch_rate": round(stats.receiving_catches / stats.receiving_targets * 100, 1) if stats.receiving_targets > 0 else 0,
+        
+        # WR/TE rushing (e.g., jet sweeps, end-arounds)
+        "rushing_attempts": stats.rushing_attempts,
+        "rushing_yards": stats.rushing_yards,
+        "rushing_tds": stats.rushing_tds,
+    }
+
+def _defender_stats(stats: PlayerStats) -> Optional[Dict]:
+    """Defensive box score stats (None if the defender recorded nothing)."""
+    if (stats.tackles == 0 and stats.sacks == 0 and stats.interceptions == 0 and
+        stats.forced_fumbles == 0 and stats.fumble_recoveries == 0):
+        return None
+    return {
+        "tackles": stats.tackles,
+        "sacks": stats.sacks,
+        "interceptions": stats.interceptions,
+        "forced_fumbles": stats.forced_fumbles,
+        "fumble_recoveries": stats.fumble_recoveries,
+        "defensive_tds": stats.defensive_tds,
+    }
+
+# Box score stats for each position reported after a game (other positions
+# aren't reported)
+POSITION_EXTRACTORS: Dict[str, Callable[[PlayerStats], Optional[Dict]]] = {
+    "QB": _qb_stats,
+    "RB": _rb_stats,
+    "WR": _receiver_stats,
+    "TE": _receiver_stats,
+    "LB": _defender_stats,
+    "DL": _defender_stats,
+    "CB": _defender_stats,
+    "S": _defender_stats,
+}
+
 @dataclass
 class Game:
     """
     Represents a football game simulation between two teams.
     Contains all the logic for simulating plays and game flow.
+    
+    Unlike the other classes here Game has no __slots__: SimulationEngine
+    keeps its own game state (game.home_score, game.current_possession, ...)
+    as attributes on it.
     """
     home_team: Team
     away_team: Team
@@ -228,7 +638,8 @@ class Game:
     def __post_init__(self):
         """Initialize game state after creation."""
         # Set possession to home team to start
-        self.state.possession = self.home_team.id
+        self.state.team_ids = (self.home_team.id, self.away_team.id)
+        self.state.possession_index = 0
         
         # Prepare teams for the game
         self.home_team.prepare_for_game(is_home=True)
@@ -237,237 +648,143 @@ class Game:
         # Reset stats
         self.home_team.reset_for_new_game()
         self.away_team.reset_for_new_game()
+        
+        # Weather doesn't change during a game, so work out its effects once
+        self._weather_factors = self.conditions.get_weather_factors()
+        
+        # Team ratings and tendencies only depend on the rosters, so look
+        # them up once per game rather than on every play
+        # (home, away), indexed like GameState.possession_index
+        self._teams = teams = (self.home_team, self.away_team)
+        self._off_rating = {team.id: team.get_offensive_rating() for team in teams}
+        self._def_rating = {team.id: team.get_defensive_rating() for team in teams}
+        self._pass_tendency = {team.id: team.attributes.pass_tendency for team in teams}
+        
+        # Starters involved in each play: (QB, RB, WR) on offense, (LB, CB, S) on defense
+        self._offense_starters = {
+            team.id: (team.get_starter("QB"), team.get_starter("RB"), team.get_starter("WR"))
+            for team in teams
+        }
+        self._defense_starters = {
+            team.id: (team.get_starter("LB"), team.get_starter("CB"), team.get_starter("S"))
+            for team in teams
+        }
+        
+        # Stat buffer for each starter (None where there's no starter), keyed
+        # by player ID for flushing
+        self._stat_buffers = {}
+        for starters in (*self._offense_starters.values(), *self._defense_starters.values()):
+            for player in starters:
+                if player is not None and player.id not in self._stat_buffers:
+                    self._stat_buffers[player.id] = (player, array("i", [0]) * len(STAT_FIELDS))
+        self._offense_buffers = {
+            team_id: tuple(self._stat_buffers[p.id][1] if p is not None else None for p in starters)
+            for team_id, starters in self._offense_starters.items()
+        }
+        self._defense_buffers = {
+            team_id: tuple(self._stat_buffers[p.id][1] if p is not None else None for p in starters)
+            for team_id, starters in self._defense_starters.items()
+        }
+        
+        # Offense-only play factors: (yards scale, interception chance, fumble chance)
+        self._play_factors = {
+            team.id: offense_play_factors(
+                self._off_rating[team.id], *self._offense_starters[team.id][:2]
+            )
+            for team in teams
+        }
+        
+        # Normal random numbers for yards gained, drawn in bulk
+        self._normals = NormalPool()
+        
+        # Skip building, storing and printing play results when nobody will
+        # see them (set verbose/log_plays when creating the game)
+        if self.verbose or self.log_plays:
+            self.simulate_play = self._simulate_play_full
+        else:
+            self.simulate_play = self._simulate_play_fast
     
     def get_possession_team(self) -> Team:
         """Get the team currently with possession."""
-        return self.home_team if self.state.possession == self.home_team.id else self.away_team
+        return self.away_team if self.state.possession_index else self.home_team
     
     def get_defense_team(self) -> Team:
         """Get the team currently on defense."""
-        return self.away_team if self.state.possession == self.home_team.id else self.home_team
+        return self.home_team if self.state.possession_index else self.away_team
     
-    def simulate_play(self) -> Dict:
+    def _simulate_play_full(self) -> PlayResult:
         """
         Simulate a single play and return the result.
         Enhanced to track more detailed player statistics.
+        
+        Bound as simulate_play when plays are logged or printed. Player stats
+        are counted in per-player buffers and added to the players at the
+        end of simulate_game.
         """
-        offense = self.get_possession_team()
-        defense = self.get_defense_team()
+        possession_index = self.state.possession_index
+        offense = self._teams[possession_index]
+        defense = self._teams[possession_index ^ 1]
         
         # Get key players
-        qb = offense.get_starter("QB")
-        rb = offense.get_starter("RB")
-        wr = offense.get_starter("WR")
+        qb, rb, wr = self._offense_starters[offense.id]
         
         # Get key defensive players
-        linebacker = defense.get_starter("LB")
-        cornerback = defense.get_starter("CB")
-        safety = defense.get_starter("S")
+        linebacker, cornerback, safety = self._defense_starters[defense.id]
         
         # Determine play type (simplified)
-        is_pass = random.random() < offense.attributes.pass_tendency
+        is_pass = random.random() < self._pass_tendency[offense.id]
         
         # Basic result calculation
-        off_rating = offense.get_offensive_rating()
-        def_rating = defense.get_defensive_rating()
-        
-        # Apply weather factors
-        weather_factors = self.conditions.get_weather_factors()
+        off_rating = self._off_rating[offense.id]
+        def_rating = self._def_rating[defense.id]
         
         # Base success probability
         success_prob = 0.5 + (off_rating - def_rating) * 0.3
         
         # Play outcome
-        result = {}
-        result["play_type"] = "pass" if is_pass else "run"
-        result["down"] = self.state.down
-        result["distance"] = self.state.distance
-        result["field_position"] = self.state.field_position
-        result["quarter"] = self.clock.quarter
-        result["time"] = f"{self.clock.minutes}:{self.clock.seconds:02d}"
-        
-        # Defensive player involvement (for tracking stats)
-        primary_defender = None
-        secondary_defenders = []
-        
-        # Simulate the play
+        result = PlayResult(
+            "pass" if is_pass else "run",
+            self.state.down,
+            self.state.distance,
+            self.state.field_position,
+            self.clock.quarter,
+            self.clock.quarter_seconds_left()
+        )
+        
+        # Draw the outcome of the play (a pass without a QB is incomplete and
+        # a run without an RB gains nothing)
+        yards_scale, int_chance, fumble_chance = self._play_factors[offense.id]
+        outcome, yards_gained, is_touchdown, defender_recovers = draw_play_outcome(
+            is_pass, success_prob, self._weather_factors["passing_modifier"], yards_scale,
+            100 - self.state.field_position, int_chance, fumble_chance,
+            self._normals.normalvariate
+        )
+        self._update_player_stats(
+            self._offense_buffers[offense.id], self._defense_buffers[defense.id], is_pass,
+            outcome, yards_gained, is_touchdown, defender_recovers
+        )
+        
+        result.result = outcome
+        result.yards_gained = yards_gained
         if is_pass:
-            # Pass play
             if qb:
-                completion_prob = success_prob * weather_factors["passing_modifier"]
-                is_complete = random.random() < completion_prob
-                
-                # Select target receiver (simplified - could expand to multiple receivers)
-                receiver = wr
-                
-                # Select primary defender
-                primary_defender = cornerback
-                secondary_defenders = [safety] if safety else []
-                
-                if is_complete:
-                    # Determine yards gained
-                    base_yards = random.normalvariate(6, 4)  # Slightly more conservative
-                    yards_gained = max(0, int(base_yards * (0.7 + off_rating * 0.3)))
-                    
-                    # Check for touchdown
-                    is_touchdown = self.state.field_position + yards_gained >= 100
-                    
-                    # Make long touchdowns more rare
-                    if is_touchdown and self.state.field_position < 75:
-                        # Less likely to score from far away
-                        if random.random() > 0.08:  # Only 8% chance of long TD
-                            yards_gained = min(yards_gained, 25)  # Cap the gain
-                            is_touchdown = False
-                    
-                    # Update offensive player stats
-                    qb.stats.passing_attempts += 1
-                    qb.stats.passing_completions += 1
-                    qb.stats.passing_yards += yards_gained
-                    
-                    if receiver:
-                        receiver.stats.receiving_targets += 1
-                        receiver.stats.receiving_catches += 1
-                        receiver.stats.receiving_yards += yards_gained
-                    
-                    if is_touchdown:
-                        qb.stats.passing_tds += 1
-                        if receiver:
-                            receiver.stats.receiving_tds += 1
-                    
-                    # Update defensive player stats
-                    if primary_defender:
-                        primary_defender.stats.tackles += 1
-                    
-                    result["yards_gained"] = yards_gained
-                    result["result"] = "complete"
-                    result["passer"] = qb.id if qb else None
-                    result["receiver"] = receiver.id if receiver else None
-                    result["primary_defender"] = primary_defender.id if primary_defender else None
-                else:
-                    # Incomplete pass
-                    yards_gained = 0
-                    
-                    # Check for interception
-                    int_chance = 0.08 * (1 - qb.attributes.decision_making / 100)
-                    is_interception = random.random() < int_chance
-                    
-                    # Update stats
-                    qb.stats.passing_attempts += 1
-                    
-                    if receiver:
-                        receiver.stats.receiving_targets += 1
-                    
-                    if is_interception:
-                        qb.stats.passing_ints += 1
-                        result["is_interception"] = True
-                        result["result"] = "interception"
-                        
-                        # Defense stats
-                        if primary_defender:
-                            primary_defender.stats.interceptions += 1
-                    else:
-                        result["result"] = "incomplete"
-                    
-                    result["yards_gained"] = yards_gained
-                    result["passer"] = qb.id if qb else None
-                    result["receiver"] = receiver.id if receiver else None
-                    result["primary_defender"] = primary_defender.id if primary_defender else None
-            else:
-                # No QB available (extremely rare case)
-                result["result"] = "incomplete"
-                result["yards_gained"] = 0
-        else:
-            # Run play
-            if rb:
-                # Determine yards gained
-                base_yards = random.normalvariate(3.5, 2.5)  # More realistic average
-                yards_gained = max(-2, int(base_yards * (0.7 + off_rating * 0.3)))
-                
-                # Select primary defender for the tackle
-                primary_defender = linebacker
-                secondary_defenders = [safety] if safety else []
-                
-                # Check for touchdown
-                is_touchdown = self.state.field_position + yards_gained >= 100
-                
-                # Make long touchdowns more rare
-                if is_touchdown and self.state.field_position < 80:
-                    # Less likely to score from far away
-                    if random.random() > 0.1:  # Only 10% chance of long TD
-                        yards_gained = min(yards_gained, 20)  # Cap the gain
-                        is_touchdown = False
-                
-                # Update stats
-                rb.stats.rushing_attempts += 1
-                rb.stats.rushing_yards += yards_gained
-                
-                if is_touchdown:
-                    rb.stats.rushing_tds += 1
-                    result["is_touchdown"] = True
-                    
-                # Update defensive player stats
-                if primary_defender:
-                    primary_defender.stats.tackles += 1
-                    
-                if secondary_defenders and yards_gained > 5:
-                    # Secondary tackler for longer runs
-                    secondary_defenders[0].stats.tackles += 1
-                    
-                # Check for fumble
-                fumble_chance = 0.03 * (1 - rb.attributes.strength / 200)
-                is_fumble = random.random() < fumble_chance
-                
-                if is_fumble:
-                    rb.stats.fumbles += 1
-                    result["is_fumble"] = True
-                    result["result"] = "fumble"
-                    
-                    # Defense stats
-                    if primary_defender:
-                        primary_defender.stats.forced_fumbles += 1
-                        # 50% chance primary defender recovers the fumble
-                        if random.random() > 0.5:
-                            primary_defender.stats.fumble_recoveries += 1
-                else:
-                    result["result"] = "run"
-                
-                result["yards_gained"] = yards_gained
-                result["runner"] = rb.id if rb else None
-                result["primary_defender"] = primary_defender.id if primary_defender else None
-            else:
-                # No RB available (extremely rare case)
-                result["result"] = "run"
-                result["yards_gained"] = 0
-        
-        # Clock management (simplified)
-        time_elapsed = 30  # Average play time in seconds
-        if not (result.get("is_touchdown") or result.get("is_interception") or 
-                result.get("is_fumble") or result["result"] == "incomplete"):
-            # Clock runs on successful plays
-            self.clock.advance(time_elapsed)
-        
-        # Update game state
-        if result.get("is_interception") or result.get("is_fumble"):
-            # Turnover - change possession
-            self.state.change_possession()
-        else:
-            # Update down, distance, field position
-            yards_gained = result["yards_gained"]
-            self.state.update_field_position(yards_gained)
-            self.state.update_down_and_distance(yards_gained)
-            
-            if result.get("is_touchdown"):
-                # Handle touchdown
-                if self.state.possession == self.home_team.id:
-                    self.state.home_score += 7  # Simplified, assuming extra point
-                else:
-                    self.state.away_score += 7
-                
-                # Reset after touchdown
-                self.state.change_possession()
-            elif self.state.down > 4:
-                # Turnover on downs
-                self.state.change_possession()
+                result.passer = qb.id
+                result.receiver = wr.id if wr else None
+                result.primary_defender = cornerback.id if cornerback else None
+                result.is_interception = outcome == "interception"
+        elif rb:
+            result.runner = rb.id
+            result.primary_defender = linebacker.id if linebacker else None
+            result.is_touchdown = is_touchdown
+            result.is_fumble = outcome == "fumble"
+        
+        # Update clock, down and distance, score and possession
+        apply_play_to_state(
+            self.state, self.clock, result.yards_gained,
+            result.is_touchdown,
+            result.is_interception or result.is_fumble,
+            result.result == "incomplete"
+        )
         
         # Record play in history
         if self.log_plays:
@@ -475,19 +792,147 @@ class Game:
         
         # Verbose output
         if self.verbose:
-            print(f"Q{self.clock.quarter} {self.clock.minutes}:{self.clock.seconds:02d} - ", end="")
+            print(f"{self.clock} - ", end="")
             print(f"{self.state.down} & {self.state.distance} at {self.state.field_position} yard line")
             
             if is_pass:
-                print(f"Play: {qb.name if qb else 'QB'} {result['result']} to {receiver.name if receiver else 'receiver'} for {result['yards_gained']} yards")
+                print(f"Play: {qb.name if qb else 'QB'} {result.result} to {wr.name if wr else 'receiver'} for {result.yards_gained} yards")
             else:
-                print(f"Play: {rb.name if rb else 'RB'} {result['result']} for {result['yards_gained']} yards")
+                print(f"Play: {rb.name if rb else 'RB'} {result.result} for {result.yards_gained} yards")
                 
             print(f"Score: {self.home_team.name} {self.state.home_score} - {self.away_team.name} {self.state.away_score}")
             print()
         
         return result
     
+    def _simulate_play_fast(self) -> Tuple[int, bool, bool, bool]:
+        """
+        Simulate a single play like _simulate_play_full, but without building
+        a PlayResult (bound as simulate_play when plays are neither logged
+        nor printed).
+        
+        Returns:
+            Tuple of (yards gained, touchdown, interception, fumble)
+        """
+        possession_index = self.state.possession_index
+        offense = self._teams[possession_index]
+        defense = self._teams[possession_index ^ 1]
+        
+        is_pass = random.random() < self._pass_tendency[offense.id]
+        success_prob = 0.5 + (self._off_rating[offense.id] - self._def_rating[defense.id]) * 0.3
+        
+        yards_scale, int_chance, fumble_chance = self._play_factors[offense.id]
+        outcome, yards_gained, is_touchdown, defender_recovers = draw_play_outcome(
+            is_pass, success_prob, self._weather_factors["passing_modifier"], yards_scale,
+            100 - self.state.field_position, int_chance, fumble_chance,
+            self._normals.normalvariate
+        )
+        self._update_player_stats(
+            self._offense_buffers[offense.id], self._defense_buffers[defense.id], is_pass,
+            outcome, yards_gained, is_touchdown, defender_recovers
+        )
+        
+        # Only run touchdowns are scored, as in _simulate_play_full
+        is_touchdown = is_touchdown and not is_pass
+        is_interception = outcome == "interception"
+        is_fumble = outcome == "fumble"
+        apply_play_to_state(
+            self.state, self.clock, yards_gained,
+            is_touchdown, is_interception or is_fumble, outcome == "incomplete"
+        )
+        
+        return yards_gained, is_touchdown, is_interception, is_fumble
+    
+    def _update_player_stats(self, offense_buffers: Tuple, defense_buffers: Tuple, is_pass: bool,
+                             outcome: str, yards_gained: int, is_touchdown: bool, defender_recovers: bool):
+        """
+        Count a play in the stat buffers of the players involved (see
+        _flush_player_stats).
+        
+        Args:
+            offense_buffers: Stat buffers of the offense's (QB, RB, WR) starters
+            defense_buffers: Stat buffers of the defense's (LB, CB, S) starters
+            is_pass: Whether the play was a pass
+            outcome, yards_gained, is_touchdown, defender_recovers: As returned
+                by draw_play_outcome
+        """
+        qb, rb, receiver = offense_buffers
+        linebacker, cornerback, safety = defense_buffers
+        
+        if is_pass:
+            # Pass play (nobody is credited without a QB, an extremely rare case)
+            if qb is None:
+                return
+            
+            # Select primary defender
+            primary_defender = cornerback
+            
+            # Update stats
+            qb[PASSING_ATTEMPTS] += 1
+            if receiver is not None:
+                receiver[RECEIVING_TARGETS] += 1
+            
+            if outcome == "complete":
+                qb[PASSING_COMPLETIONS] += 1
+                qb[PASSING_YARDS] += yards_gained
+                
+                if receiver is not None:
+                    receiver[RECEIVING_CATCHES] += 1
+                    receiver[RECEIVING_YARDS] += yards_gained
+                
+                if is_touchdown:
+                    qb[PASSING_TDS] += 1
+                    if receiver is not None:
+                        receiver[RECEIVING_TDS] += 1
+                
+                # Update defensive player stats
+                if primary_defender is not None:
+                    primary_defender[TACKLES] += 1
+            elif outcome == "interception":
+                qb[PASSING_INTS] += 1
+                
+                # Defense stats
+                if primary_defender is not None:
+                    primary_defender[INTERCEPTIONS] += 1
+        else:
+            # Run play (nobody is credited without an RB, an extremely rare case)
+            if rb is None:
+                return
+            
+            # Select primary defender for the tackle
+            primary_defender = linebacker
+            
+            # Update stats
+            rb[RUSHING_ATTEMPTS] += 1
+            rb[RUSHING_YARDS] += yards_gained
+            
+            if is_touchdown:
+                rb[RUSHING_TDS] += 1
+            
+            # Update defensive player stats
+            if primary_defender is not None:
+                primary_defender[TACKLES] += 1
+            
+            if safety is not None and yards_gained > 5:
+                # Secondary tackler for longer runs
+                safety[TACKLES] += 1
+            
+            if outcome == "fumble":
+                rb[FUMBLES] += 1
+                
+                # Defense stats
+                if primary_defender is not None:
+                    primary_defender[FORCED_FUMBLES] += 1
+                    if defender_recovers:
+                        primary_defender[FUMBLE_RECOVERIES] += 1
+    
+    def _flush_player_stats(self):
+        """Add the stats counted in the players' buffers to their stats and clear the buffers."""
+        empty = array("i", [0]) * len(STAT_FIELDS)
+        for player, buffer in self._stat_buffers.values():
+            player.stats.add_array(buffer)
+            buffer[:] = empty
+    
     def simulate_game(self) -> Dict:
         """
         Simulate an entire game and return the final statistics.
@@ -496,15 +941,11 @@ class Game:
         # Set up game
         self.clock.start()
         
-        # Main game loop
-        while not self.clock.is_game_over():
-            self.simulate_play()
-            
-            # Check for end of quarter
-            if self.clock.seconds == 0 and self.clock.minutes == 0:
-                if self.clock.quarter < 4:
-                    self.clock.quarter += 1
-                    self.clock.reset_for_quarter()
+        # Main game loop (clock.is_game_over, inlined)
+        clock = self.clock
+        simulate_play = self.simulate_play
+        while clock.elapsed < clock.total_length:
+            simulate_play()
         
         # Game over - process results
         if self.state.home_score > self.state.away_score:
@@ -521,47 +962,28 @@ class Game:
             winner = None
         
         # Update team stats from player stats
+        self._flush_player_stats()
         self.home_team.update_team_stats_from_players()
         self.away_team.update_team_stats_from_players()
         
-        # Collect player statistics
-        home_player_stats = []
-        away_player_stats = []
-        
-        # Process offensive players first (QB, RB, WR, TE)
-        offensive_positions = ["QB", "RB", "WR", "TE"]
-        for player in self.home_team.roster.values():
-            if player.position in offensive_positions:
-                player_stats = self._extract_player_stats(player)
-                if player_stats["has_stats"]:
-                    home_player_stats.append(player_stats)
-        
-        for player in self.away_team.roster.values():
-            if player.position in offensive_positions:
-                player_stats = self._extract_player_stats(player)
-                if player_stats["has_stats"]:
-                    away_player_stats.append(player_stats)
-        
-        # Process defensive players next (LB, DL, CB, S)
-        defensive_positions = ["LB", "DL", "CB", "S"]
-        for player in self.home_team.roster.values():
-            if player.position in defensive_positions:
-                player_stats = self._extract_player_stats(player)
-                if player_stats["has_stats"]:
-                    home_player_stats.append(player_stats)
-        
-        for player in self.away_team.roster.values():
-            if player.position in defensive_positions:
+        # Collect player statistics (offensive players first: QB, RB, WR, TE,
+        # then defensive players: LB, DL, CB, S) and save them to historical
+        # records, in one pass over each roster
+        defensive_positions = {"LB", "DL", "CB", "S"}
+        player_stats_by_team = []
+        for team in (self.home_team, self.away_team):
+            offense_stats = []
+            defense_stats = []
+            for player in team.roster.values():
                 player_stats = self._extract_player_stats(player)
-                if player_stats["has_stats"]:
-                    away_player_stats.append(player_stats)
-        
-        # Save player stats to historical records
-        for player in self.home_team.roster.values():
-            player.save_game_stats()
-        
-        for player in self.away_team.roster.values():
-            player.save_game_stats()
+                if player_stats is not None:
+                    if player.position in defensive_positions:
+                        defense_stats.append(player_stats)
+                    else:
+                        offense_stats.append(player_stats)
+                player.save_game_stats()
+            player_stats_by_team.append(offense_stats + defense_stats)
+        home_player_stats, away_player_stats = player_stats_by_team
         
         # Return game summary with detailed player stats
         return {
@@ -591,98 +1013,123 @@ class Game:
             "away_player_stats": away_player_stats
         }
     
-    def _extract_player_stats(self, player) -> Dict:
+    def simulate_batch(self, n_games: int) -> Dict[str, List[int]]:
         """
-        Extract relevant statistics from a player based on position.
-        Returns a dict with player info and stats.
+        Simulate many games between these teams, tracking only the scores.
+        
+        Plays follow the same rules as simulate_play, but no player or team
+        stats, play history or output are recorded, so team and starter
+        ratings are worked out once for the whole batch. The game's own
+        state and clock are left untouched.
+        
+        Args:
+            n_games: Number of games to simulate
+            
+        Returns:
+            Dict with 'home_score', 'away_score' and 'plays' lists (one entry per game)
         """
-        # Base player info
-        player_stats = {
-            "id": player.id,
-            "name": player.name,
-            "position": player.position,
-            "team": player.team,
-            "has_stats": False  # Flag to indicate if player has any stats worth showing
-        }
+        # Everything a play needs from each team, indexed like GameState.possession_index
+        passing_modifier = self._weather_factors["passing_modifier"]
+        team_factors = []
+        for team, opponent in ((self.home_team, self.away_team), (self.away_team, self.home_team)):
+            team_factors.append((
+                self._pass_tendency[team.id],
+                0.5 + (self._off_rating[team.id] - self._def_rating[opponent.id]) * 0.3,
+                *self._play_factors[team.id]
+            ))
         
-        # Add relevant stats based on position type
-        if player.position in ["QB", "RB", "WR", "TE"]:
-            # Offensive player stats
-            stats = {}
+        team_ids = (self.home_team.id, self.away_team.id)
+        # One pool serves every game, so refill it in larger batches
+        normalvariate = NormalPool(2048).normalvariate
+        results = {"home_score": [], "away_score": [], "plays": []}
+        
+        for _ in range(n_games):
+            state = GameState(team_ids=team_ids)
+            clock = GameClock()
+            clock.start()
+            plays = 0
             
-            # QB stats
-            if player.position == "QB":
-                stats["passing_attempts"] = player.stats.passing_attempts
-                stats["passing_completions"] = player.stats.passing_completions
-                stats["passing_yards"] = player.stats.passing_yards
-                stats["passing_tds"] = player.stats.passing_tds
-                stats["passing_ints"] = player.stats.passing_ints
-                stats["comp_pct"] = round(player.stats.passing_completions / player.stats.passing_attempts * 100, 1) if player.stats.passing_attempts > 0 else 0
-                stats["yards_per_attempt"] = round(player.stats.passing_yards / player.stats.passing_attempts, 1) if player.stats.passing_attempts > 0 else 0
-                
-                # QB rushing
-                stats["rushing_attempts"] = player.stats.rushing_attempts
-                stats["rushing_yards"] = player.stats.rushing_yards
-                stats["rushing_tds"] = player.stats.rushing_tds
-                
-                # Set flag if QB has any stats
-                if player.stats.passing_attempts > 0 or player.stats.rushing_attempts > 0:
-                    player_stats["has_stats"] = True
-                    
-            # RB stats
-            elif player.position == "RB":
-                stats["rushing_attempts"] = player.stats.rushing_attempts
-                stats["rushing_yards"] = player.stats.rushing_yards
-                stats["rushing_tds"] = player.stats.rushing_tds
-                stats["yards_per_carry"] = round(player.stats.rushing_yards / player.stats.rushing_attempts, 1) if player.stats.rushing_attempts > 0 else 0
+            while clock.elapsed < clock.total_length:
+                pass_tendency, success_prob, yards_scale, int_chance, fumble_chance = \
+                    team_factors[state.possession_index]
                 
-                # RB receiving
-                stats["receiving_targets"] = player.stats.receiving_targets
-                stats["receiving_catches"] = player.stats.receiving_catches
-                stats["receiving_yards"] = player.stats.receiving_yards
-                stats["receiving_tds"] = player.stats.receiving_tds
+                is_pass = random.random() < pass_tendency
+                outcome, yards_gained, is_touchdown, _ = draw_play_outcome(
+                    is_pass, success_prob, passing_modifier, yards_scale,
+                    100 - state.field_position, int_chance, fumble_chance, normalvariate
+                )
                 
-                # Set flag if RB has any stats
-                if player.stats.rushing_attempts > 0 or player.stats.receiving_targets > 0:
-                    player_stats["has_stats"] = True
-                    
-            # WR/TE stats
-            elif player.position in ["WR", "TE"]:
-                stats["receiving_targets"] = player.stats.receiving_targets
-                stats["receiving_catches"] = player.stats.receiving_catches
-                stats["receiving_yards"] = player.stats.receiving_yards
-                stats["receiving_tds"] = player.stats.receiving_tds
-                stats["yards_per_catch"] = round(player.stats.receiving_yards / player.stats.receiving_catches, 1) if player.stats.receiving_catches > 0 else 0
-                stats["catch_rate"] = round(player.stats.receiving_catches / player.stats.receiving_targets * 100, 1) if player.stats.receiving_targets > 0 else 0
-                
-                # WR/TE rushing (e.g., jet sweeps, end-arounds)
-                stats["rushing_attempts"] = player.stats.rushing_attempts
-                stats["rushing_yards"] = player.stats.rushing_yards
-                stats["rushing_tds"] = player.stats.rushing_tds
-                
-                # Set flag if WR/TE has any stats
-                if player.stats.receiving_targets > 0 or player.stats.rushing_attempts > 0:
-                    player_stats["has_stats"] = True
-                    
-        elif player.position in ["LB", "DL", "CB", "S"]:
-            # Defensive player stats
-            stats = {}
-            stats["tackles"] = player.stats.tackles
-            stats["sacks"] = player.stats.sacks
-            stats["interceptions"] = player.stats.interceptions
-            stats["forced_fumbles"] = player.stats.forced_fumbles
-            stats["fumble_recoveries"] = player.stats.fumble_recoveries
-            stats["defensive_tds"] = player.stats.defensive_tds
+                # Only run touchdowns are scored, as in simulate_play
+                apply_play_to_state(
+                    state, clock, yards_gained,
+                    is_touchdown and not is_pass,
+                    outcome in ("interception", "fumble"),
+                    outcome == "incomplete"
+                )
+                plays += 1
             
-            # Set flag if defensive player has any stats
-            if (player.stats.tackles > 0 or player.stats.sacks > 0 or player.stats.interceptions > 0 or
-                player.stats.forced_fumbles > 0 or player.stats.fumble_recoveries > 0):
-                player_stats["has_stats"] = True
+            results["home_score"].append(state.home_score)
+            results["away_score"].append(state.away_score)
+            results["plays"].append(plays)
+        
+        return results
+    
+    def _extract_player_stats(self, player) -> Optional[Dict]:
+        """
+        Extract relevant statistics from a player based on position.
+        Returns a dict with player info and stats, or None if the player
+        has no stats worth showing (e.g. didn't get the ball).
+        """
+        extractor = POSITION_EXTRACTORS.get(player.position)
+        if extractor is None:
+            return None
         
-        # Add stats to player_stats dict
-        player_stats["stats"] = stats
+        stats = extractor(player.stats)
+        if stats is None:
+            return None
         
-        # Add fantasy points
-        player_stats["fantasy_points"] = player.stats.calculate_fantasy_points()
+        return {
+            "id": player.id,
+            "name": player.name,
+            "position": player.position,
+            "team": player.team,
+            "has_stats": True,
+            "stats": stats,
+            "fantasy_points": player.stats.calculate_fantasy_points()
+        }
+
+def _simulate_matchup(home_team: Team, away_team: Team, seed: int) -> Dict:
+    """Simulate one game with the random module seeded first (used by worker processes)."""
+    random.seed(seed)
+    return Game(home_team=home_team, away_team=away_team).simulate_game()
+
+def run_season(matchups: List[Tuple[Team, Team]], n_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Simulate a list of independent games (e.g. a season's schedule), spread
+    over worker processes.
+    
+    Each game gets its own seed drawn from the random module, so results
+    only depend on its state when this is called, not on the number of
+    workers. Worker processes play the games with copies of the teams, so
+    the teams' own stats and histories are only updated with n_workers=1.
+    
+    Args:
+        matchups: (home team, away team) for each game
+        n_workers: Number of worker processes (None for one per CPU core,
+            1 to simulate the games in this process)
         
-        return player_stats
\ No newline at end of file
+    Returns:
+        simulate_game's results for each matchup, in order
+    """
+    seeds = [random.getrandbits(64) for _ in matchups]
+    
+    if n_workers == 1 or len(matchups) < 2:
+        return [_simulate_matchup(home, away, seed) for (home, away), seed in zip(matchups, seeds)]
+    
+    # Send games to the workers a few chunks each rather than one at a time
+    workers = n_workers or os.cpu_count() or 1
+    chunksize = max(1, len(matchups) // (workers * 4))
+    home_teams = [home for home, _ in matchups]
+    away_teams = [away for _, away in matchups]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(_simulate_matchup, home_teams, away_teams, seeds, chunksize=chunksize))
@@ -1,8 +1,11 @@
 # models/player.py
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from array import array
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+from operator import attrgetter, mul
+from typing import Dict, Iterable, List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     """Container for player statistics that can be updated during simulation."""
     # Offensive stats
@@ -33,53 +36,125 @@ class PlayerStats:
     
     def calculate_fantasy_points(self, scoring_system='standard') -> float:
         """Calculate fantasy points based on the stats and specified scoring system."""
-        points = 0
-        
-        if scoring_system == 'standard':
-            # Passing
-            points += self.passing_yards * 0.04  # 1 point per 25 yards
-            points += self.passing_tds * 4
-            points -= self.passing_ints * 2
-            
-            # Rushing
-            points += self.rushing_yards * 0.1  # 1 point per 10 yards
-            points += self.rushing_tds * 6
-            
-            # Receiving
-            points += self.receiving_yards * 0.1  # 1 point per 10 yards
-            points += self.receiving_catches * 0  # 0 points in standard
-            points += self.receiving_tds * 6
-            
-            # Misc
-            points -= self.fumbles * 2
-            
-        elif scoring_system == 'ppr':
-            # Same as standard but with PPR
-            points += self.passing_yards * 0.04
-            points += self.passing_tds * 4
-            points -= self.passing_ints * 2
-            
-            points += self.rushing_yards * 0.1
-            points += self.rushing_tds * 6
-            
-            points += self.receiving_yards * 0.1
-            points += self.receiving_catches * 1  # 1 point per reception
-            points += self.receiving_tds * 6
-            
-            points -= self.fumbles * 2
-            
-        # We can add more scoring systems as needed
+        scored = _SCORED_STATS.get(scoring_system)
+        if scored is None:
+            return 0
         
-        return points
+        get_stats, points_per_stat = scored
+        return sum(map(mul, get_stats(self), points_per_stat))
     
     def reset(self):
         """Reset all stats to zero."""
-        for attr in self.__dict__:
-            setattr(self, attr, 0)
+        self.passing_attempts = 0
+        self.passing_completions = 0
+        self.passing_yards = 0
+        self.passing_tds = 0
+        self.passing_ints = 0
+        
+        self.rushing_attempts = 0
+        self.rushing_yards = 0
+        self.rushing_tds = 0
+        
+        self.receiving_targets = 0
+        self.receiving_catches = 0
+        self.receiving_yards = 0
+        self.receiving_tds = 0
+        
+        self.fumbles = 0
+        
+        self.tackles = 0
+        self.sacks = 0
+        self.interceptions = 0
+        self.forced_fumbles = 0
+        self.fumble_recoveries = 0
+        self.defensive_tds = 0
+    
+    def as_array(self) -> array:
+        """Return the stats as an int array, indexed by StatIdx."""
+        return array("i", _get_stat_fields(self))
+    
+    def add_array(self, values: Iterable[int]):
+        """Add a row of stats (indexed by StatIdx, e.g. from as_array) to these stats."""
+        for name, value in zip(STAT_FIELDS, values):
+            if value:
+                setattr(self, name, getattr(self, name) + value)
+    
+    @classmethod
+    def from_array(cls, values: Iterable[int]) -> "PlayerStats":
+        """Create stats from a row of stats indexed by StatIdx."""
+        return cls(*values)
+
+# Fixed order of the PlayerStats fields when stored as rows of ints (as_array),
+# with StatIdx naming each position (StatIdx.PASSING_YARDS == 2, ...)
+STAT_FIELDS = tuple(f.name for f in fields(PlayerStats))
+StatIdx = IntEnum("StatIdx", [(name.upper(), index) for index, name in enumerate(STAT_FIELDS)])
+_get_stat_fields = attrgetter(*STAT_FIELDS)
+
+# Fantasy points per unit of each stat, by scoring system (stats not listed
+# score nothing). More scoring systems can be added here.
+FANTASY_SCORING = {
+    'standard': {
+        'passing_yards': 0.04,  # 1 point per 25 yards
+        'passing_tds': 4,
+        'passing_ints': -2,
+        'rushing_yards': 0.1,  # 1 point per 10 yards
+        'rushing_tds': 6,
+        'receiving_yards': 0.1,  # 1 point per 10 yards
+        'receiving_tds': 6,
+        'fumbles': -2,
+    },
+    'ppr': {
+        # Same as standard but with PPR
+        'passing_yards': 0.04,
+        'passing_tds': 4,
+        'passing_ints': -2,
+        'rushing_yards': 0.1,
+        'rushing_tds': 6,
+        'receiving_yards': 0.1,
+        'receiving_catches': 1,  # 1 point per reception
+        'receiving_tds': 6,
+        'fumbles': -2,
+    },
+}
+
+# Points per stat for each scoring system as coefficients indexed by StatIdx,
+# for scoring stat rows (see fantasy_points_from_array)
+SCORING_COEFFS = {
+    system: tuple(points.get(name, 0) for name in STAT_FIELDS)
+    for system, points in FANTASY_SCORING.items()
+}
+
+# Getter for the scored stats of each system and their points, used by
+# PlayerStats.calculate_fantasy_points
+_SCORED_STATS = {
+    system: (attrgetter(*points), tuple(points.values()))
+    for system, points in FANTASY_SCORING.items()
+}
 
-@dataclass
+def fantasy_points_from_array(stats: Iterable[int], scoring_system: str = 'standard') -> float:
+    """
+    Calculate fantasy points for a row of stats (indexed by StatIdx, e.g.
+    from PlayerStats.as_array).
+    
+    Args:
+        stats: Stat row
+        scoring_system: Key of FANTASY_SCORING
+        
+    Returns:
+        Fantasy points (0 for an unknown scoring system)
+    """
+    coeffs = SCORING_COEFFS.get(scoring_system)
+    if coeffs is None:
+        return 0
+    return sum(map(mul, stats, coeffs))
+
+@dataclass(slots=True)
 class PlayerAttributes:
-    """Player attributes that influence performance in simulations."""
+    """
+    Player attributes that influence performance in simulations.
+    Change attributes with set_attribute, which keeps the attribute total
+    used by Player.predict_performance up to date.
+    """
     # General attributes (0-100 scale)
     speed: int = 50
     strength: int = 50
@@ -110,8 +185,29 @@ class PlayerAttributes:
     
     # Custom attributes dict for future expansion
     custom: Dict[str, float] = field(default_factory=dict)
+    
+    # Sum of the numeric attributes (NUMERIC_ATTRIBUTES)
+    _total: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._total = sum(_get_numeric_attributes(self))
+    
+    def set_attribute(self, name: str, value: int):
+        """Set a numeric attribute (e.g. 'speed') and update the attribute total."""
+        setattr(self, name, value)
+        self._total = sum(_get_numeric_attributes(self))
+
+# Numeric PlayerAttributes fields (everything but custom)
+NUMERIC_ATTRIBUTES = (
+    'speed', 'strength', 'agility', 'awareness',
+    'throwing_power', 'throwing_accuracy', 'decision_making',
+    'catching', 'elusiveness', 'route_running', 'breaking_tackles',
+    'tackling', 'coverage', 'block_shedding',
+    'clutch', 'injury_prone', 'consistency',
+)
+_get_numeric_attributes = attrgetter(*NUMERIC_ATTRIBUTES)
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """
     Represents a football player with identity, attributes, and statistics.
@@ -128,16 +224,17 @@ class Player:
     attributes: PlayerAttributes = field(default_factory=PlayerAttributes)
     stats: PlayerStats = field(default_factory=PlayerStats)
     
-    # Historical data for learning
-    historical_stats: List[PlayerStats] = field(default_factory=list)
+    # Historical data for learning: the stats of each saved game as rows of
+    # ints indexed by StatIdx, stored one after another (see historical_stats)
+    historical_stats_matrix: array = field(default_factory=lambda: array("i"), repr=False)
     
     # Performance modifiers
     injury_status: Optional[str] = None
     game_status: str = "active"  # active, questionable, doubtful, out
     confidence: float = 1.0  # Multiplier for performance (0.5 = playing at 50%)
     
-    # Track fantasy points for DFS analysis
-    fantasy_points_history: List[float] = field(default_factory=list)
+    # Track fantasy points for DFS analysis (one double per saved game)
+    fantasy_points_history: array = field(default_factory=lambda: array("d"), repr=False)
     
     def predict_performance(self, opponent, game_conditions):
         """
@@ -146,24 +243,32 @@ class Player:
         """
         # In the future, this could use ML models to predict performance
         # For now, return a simple estimate based on attributes
-        base_value = sum([
-            getattr(self.attributes, attr) 
-            for attr in self.attributes.__dict__ 
-            if not attr.startswith('_') and attr != 'custom'
-        ]) / 1000  # Normalize
+        base_value = self.attributes._total / 1000  # Normalize
         
         return base_value * self.confidence
     
+    @property
+    def historical_stats(self) -> List[PlayerStats]:
+        """Stats of each saved game, oldest first (copies; see historical_stats_matrix)."""
+        matrix = self.historical_stats_matrix
+        row_length = len(STAT_FIELDS)
+        return [
+            PlayerStats.from_array(matrix[start:start + row_length])
+            for start in range(0, len(matrix), row_length)
+        ]
+    
     def save_game_stats(self):
         """Save current game stats to historical record."""
-        self.historical_stats.append(self.stats)
+        # Read the stats once into a row, which is archived and scored
+        row = self.stats.as_array()
+        self.historical_stats_matrix.extend(row)
         
         # Calculate and save fantasy points
-        fp = self.stats.calculate_fantasy_points()
+        fp = fantasy_points_from_array(row)
         self.fantasy_points_history.append(fp)
         
-        # Reset current stats for next game
-        self.stats = PlayerStats()
+        # Reset current stats for next game (in place)
+        self.stats.reset()
         
     def get_average_fantasy_points(self):
         """Calculate the player's average fantasy points over their history."""
@@ -1,9 +1,9 @@
 # models/team.py
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 from .player import Player
 
-@dataclass
+@dataclass(slots=True)
 class TeamStats:
     """Container for team-level statistics."""
     # Offensive stats
@@ -34,12 +34,28 @@ class TeamStats:
     ties: int = 0
     
     def reset_game_stats(self):
-        """Reset stats that apply to a single game."""
-        for attr in self.__dict__:
-            if attr not in ['wins', 'losses', 'ties']:
-                setattr(self, attr, 0)
+        """Reset stats that apply to a single game (wins, losses and ties are kept)."""
+        self.points_scored = 0
+        self.total_yards = 0
+        self.passing_yards = 0
+        self.rushing_yards = 0
+        self.first_downs = 0
+        self.third_down_conversions = 0
+        self.third_down_attempts = 0
+        self.fourth_down_conversions = 0
+        self.fourth_down_attempts = 0
+        self.turnovers = 0
+        self.time_of_possession = 0
+        
+        self.points_allowed = 0
+        self.yards_allowed = 0
+        self.passing_yards_allowed = 0
+        self.rushing_yards_allowed = 0
+        self.sacks = 0
+        self.interceptions = 0
+        self.fumbles_recovered = 0
 
-@dataclass
+@dataclass(slots=True)
 class TeamAttributes:
     """Team-level attributes that influence simulation outcomes."""
     # Team identity factors
@@ -66,7 +82,7 @@ class TeamAttributes:
     # Custom attributes for future expansion
     custom: Dict[str, float] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """
     Represents a football team with roster, attributes, and statistics.
@@ -87,11 +103,29 @@ class Team:
     depth_chart: Dict[str, List[str]] = field(default_factory=dict)
     
     # Current game state
-    current_injuries: List[str] = field(default_factory=list)  # List of injured player IDs
+    current_injuries: Set[str] = field(default_factory=set)  # Set of injured player IDs
+    
+    # Starter for each position, filled in by prepare_for_game
+    _starters_cache: Optional[Dict[str, Player]] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Ratings, worked out on first use (None until then, see mark_dirty)
+    _off_rating_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _def_rating_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
+    def mark_dirty(self):
+        """
+        Drop the cached starters and ratings, so they're worked out again.
+        Call after changing the depth chart or team/player attributes
+        directly (add_player and prepare_for_game do this themselves).
+        """
+        self._starters_cache = None
+        self._off_rating_cache = None
+        self._def_rating_cache = None
     
     def add_player(self, player: Player):
         """Add a player to the team roster."""
         self.roster[player.id] = player
+        self.mark_dirty()
         
         # Update depth chart
         if player.position not in self.depth_chart:
@@ -102,6 +136,10 @@ class Team:
     
     def get_starter(self, position: str) -> Optional[Player]:
         """Get the starting player for a given position."""
+        # Starters are looked up once per game (see prepare_for_game)
+        if self._starters_cache is not None:
+            return self._starters_cache.get(position)
+        
         if position in self.depth_chart and self.depth_chart[position]:
             player_id = self.depth_chart[position][0]
             if player_id in self.roster:
@@ -110,6 +148,9 @@ class Team:
     
     def get_offensive_rating(self) -> float:
         """Calculate the team's overall offensive rating."""
+        if self._off_rating_cache is not None:
+            return self._off_rating_cache
+        
         # Get key offensive players
         qb = self.get_starter("QB")
         rb = self.get_starter("RB")
@@ -136,10 +177,14 @@ class Team:
         # Coaching adjustment
         base_rating *= (0.7 + (self.attributes.coaching_quality / 100 * 0.3))
         
-        return base_rating / 100  # Normalize to 0-1 scale
+        self._off_rating_cache = base_rating / 100  # Normalize to 0-1 scale
+        return self._off_rating_cache
     
     def get_defensive_rating(self) -> float:
         """Calculate the team's overall defensive rating."""
+        if self._def_rating_cache is not None:
+            return self._def_rating_cache
+        
         # Base on team defensive attributes
         base_rating = (
             self.attributes.defensive_line_rating * 0.4 +
@@ -147,19 +192,31 @@ class Team:
             self.attributes.coaching_quality * 0.2
         )
         
-        return base_rating / 100  # Normalize to 0-1 scale
+        self._def_rating_cache = base_rating / 100  # Normalize to 0-1 scale
+        return self._def_rating_cache
     
     def prepare_for_game(self, is_home: bool = False):
         """
         Prepare the team for a game, setting appropriate modifiers
         based on home/away status, injuries, etc.
         """
+        # Work out the starter at each position from the current depth chart
+        # (ratings are worked out again on next use)
+        self.mark_dirty()
+        starters = {}
+        for position in self.depth_chart:
+            starter = self.get_starter(position)
+            if starter is not None:
+                starters[position] = starter
+        self._starters_cache = starters
+        
         game_modifier = self.attributes.home_field_advantage if is_home else 1.0
         
         # Apply game modifier to each player
+        injuries = self.current_injuries
         for player_id, player in self.roster.items():
             # Skip injured players
-            if player_id in self.current_injuries:
+            if player_id in injuries:
                 player.game_status = "out"
                 player.confidence = 0.0
                 continue
@@ -170,26 +227,28 @@ class Team:
     
     def update_team_stats_from_players(self):
         """Aggregate player stats to team level."""
-        # Reset certain team stats
-        self.stats.passing_yards = 0
-        self.stats.rushing_yards = 0
-        self.stats.sacks = 0
-        self.stats.interceptions = 0
-        
-        # Aggregate from players
+        # Aggregate from players into locals, then set the team stats once
+        passing_yards = rushing_yards = sacks = interceptions = 0
         for player in self.roster.values():
-            self.stats.passing_yards += player.stats.passing_yards
-            self.stats.rushing_yards += player.stats.rushing_yards
-            self.stats.sacks += player.stats.sacks
-            self.stats.interceptions += player.stats.interceptions
+            player_stats = player.stats
+            passing_yards += player_stats.passing_yards
+            rushing_yards += player_stats.rushing_yards
+            sacks += player_stats.sacks
+            interceptions += player_stats.interceptions
+        
+        team_stats = self.stats
+        team_stats.passing_yards = passing_yards
+        team_stats.rushing_yards = rushing_yards
+        team_stats.sacks = sacks
+        team_stats.interceptions = interceptions
         
         # Update total yards
-        self.stats.total_yards = self.stats.passing_yards + self.stats.rushing_yards
+        team_stats.total_yards = passing_yards + rushing_yards
     
     def reset_for_new_game(self):
         """Reset the team for a new game simulation."""
         self.stats.reset_game_stats()
         
-        # Reset all player game stats
+        # Reset all player game stats (in place, rather than a new stats object per player)
         for player in self.roster.values():
-            player.stats = player.stats.__class__()  # Create a new empty stats object
\ No newline at end of file
+            player.stats.reset()
\ No newline at end of file
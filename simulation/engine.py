@@ -6,6 +6,17 @@ from datetime import datetime
 import uuid
 from data.nfl_data_provider import NFLDataProvider
 
+def _simulate_seeded_game(engine, home_team, away_team, verbose, seed):
+    """
+    Simulate one game with the random module seeded first (used by worker processes)
+    
+    The engine arrives pickled from the parent process, so it must not carry
+    random values drawn ahead of time (the data provider draws each play's
+    yards when it's needed); the seed alone decides the game.
+    """
+    random.seed(seed)
+    return engine.simulate_game(home_team, away_team, verbose=verbose)
+
 class SimulationEngine:
     """
     Engine for simulating football games
@@ -42,8 +53,7 @@ class SimulationEngine:
         self.load_default_teams()
         
         # Add NFL data provider
-        self.data_provider = NFLDataProvider()
-        self.data_provider.load_data()
+        self.data_provider = NFLDataProvider.get_default()
         
         # Initialize random state
         random.seed(datetime.now().timestamp())
@@ -627,8 +637,7 @@ class SimulationEngine:
             }
         
         # Regular play - use data provider for play type and yards gained
-        play_type = self.data_provider.get_play_type(down, distance)
-        yards_gained = self.data_provider.get_yards_gained(play_type)
+        play_type, yards_gained = self.data_provider.sample_play(down, distance)
         
         # Initialize play result
         play_result = {
@@ -662,7 +671,7 @@ class SimulationEngine:
         return play_result
     
 
-    def simulate_multiple_games(self, home_team, away_team, num_games=1, verbose=False):
+    def simulate_multiple_games(self, home_team, away_team, num_games=1, verbose=False, n_jobs=1):
         """
         Simulate multiple games between the same teams
         
@@ -671,6 +680,8 @@ class SimulationEngine:
             away_team (Team or str): Away team or team ID
             num_games (int): Number of games to simulate
             verbose (bool): Whether to include detailed play-by-play information
+            n_jobs (int): Worker processes to spread the games over (-1 for all
+                cores); needs joblib, otherwise games run one after another
             
         Returns:
             dict: Results of multiple game simulations
@@ -685,11 +696,27 @@ class SimulationEngine:
         if not home_team or not away_team:
             raise ValueError("Invalid team(s) provided for simulation")
             
+        games = None
+        if n_jobs != 1 and num_games > 1:
+            try:
+                from joblib import Parallel, delayed
+            except ImportError:
+                pass
+            else:
+                # Give each game its own seed (drawn from this process's
+                # generator) so worker processes don't share random streams
+                seeds = [random.getrandbits(64) for _ in range(num_games)]
+                games = Parallel(n_jobs=n_jobs, backend="loky")(
+                    delayed(_simulate_seeded_game)(self, home_team, away_team, verbose, seed)
+                    for seed in seeds
+                )
+        if games is None:
+            games = (self.simulate_game(home_team, away_team, verbose=verbose) for _ in range(num_games))
+        
         all_results = []
         all_player_stats = {}
         
-        for i in range(num_games):
-            game_results = self.simulate_game(home_team, away_team, verbose=verbose)
+        for game_results in games:
             all_results.append(game_results)
             
             # Aggregate player stats across games
@@ -1151,8 +1178,8 @@ class SimulationEngine:
         
         return filepath
     
-    def run_multiple_simulations(self, home_team, away_team, num_sims=1, verbose=False):
+    def run_multiple_simulations(self, home_team, away_team, num_sims=1, verbose=False, n_jobs=1):
         """
         Alias for simulate_multiple_games to maintain compatibility with web app
         """
-        return self.simulate_multiple_games(home_team, away_team, num_games=num_sims, verbose=verbose)    
\ No newline at end of file
+        return self.simulate_multiple_games(home_team, away_team, num_games=num_sims, verbose=verbose, n_jobs=n_jobs)    
\ No newline at end of file
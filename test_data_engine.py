@@ -6,8 +6,9 @@ correctly with the NFL data provider.
 """
 
 from models.team import Team
-from simulation.engine import SimulationEngine
+from simulation.engine import SimulationEngine, _simulate_seeded_game
 import json
+import pickle
 
 def main():
     """Run a test simulation with the enhanced engine"""
@@ -101,6 +102,31 @@ def main():
     # Save multiple game results
     filepath = engine.save_results(multi_results, "test_data_multi_game")
     print(f"Multiple game results saved to: {filepath}")
+    
+    check_seeded_games(engine, home_team, away_team)
+
+def check_seeded_games(engine, home_team, away_team):
+    """
+    Check that games run in worker processes (as simulate_multiple_games does
+    with n_jobs) are decided by their seeds: different seeds give different
+    games, and the same seed gives the same game.
+    """
+    print("\nChecking seeded games...")
+    
+    def pass_yards_for_seed(seed):
+        # Each worker gets its own pickled copy of the engine and teams
+        worker_engine, worker_home, worker_away = pickle.loads(pickle.dumps((engine, home_team, away_team)))
+        results = _simulate_seeded_game(worker_engine, worker_home, worker_away, True, seed)
+        return [play.get('yards_gained') for play in results['play_history'] if play.get('play_type') == 'pass']
+    
+    first, second, repeat = pass_yards_for_seed(1), pass_yards_for_seed(2), pass_yards_for_seed(1)
+    
+    # Compare the passes both games have (values drawn ahead of time in the
+    # parent would come out in the same order in every worker)
+    num_passes = min(len(first), len(second))
+    assert first[:num_passes] != second[:num_passes], "Games with different seeds gained the same pass yards"
+    assert first == repeat, "Games with the same seed played out differently"
+    print("  Different seeds give different games, the same seed repeats its game")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file